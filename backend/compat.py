@@ -0,0 +1,9 @@
+"""
+Compatibility helpers for the supported Python versions
+"""
+
+import sys
+
+# ``slots=True`` was added to dataclasses in Python 3.10; older interpreters
+# fall back to regular ``__dict__``-backed instances.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
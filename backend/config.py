@@ -98,6 +98,7 @@ class AppConfig(BaseSettings):
     
     # Feature flags
     enable_language_detection: bool = Field(True, description="Enable automatic language detection")
+    enable_cld3: bool = Field(True, description="Use pycld3 for language detection when it is installed")
     enable_auto_backup: bool = Field(True, description="Automatically backup files before modification")
     
     @validator('temp_dir', 'backup_dir')
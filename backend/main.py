@@ -8,18 +8,23 @@ from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 import os
+import re
 import sys
+import logging
 from pathlib import Path
 from functools import lru_cache
 import time
 import socket
+import asyncio
 
 # Add backend to path
 sys.path.append(str(Path(__file__).parent))
 
-from services.plex_service import plex_service
+from services.plex_service import plex_service, SUBTITLE_EXTENSIONS
 from services.subtitle_service import subtitle_service, DualSubtitleConfig, SubtitlePosition
 
+logger = logging.getLogger(__name__)
+
 # Simple in-memory cache for show counts
 show_counts_cache: Dict[str, Dict[str, Any]] = {}
 CACHE_TTL = 300  # 5 minutes TTL for cache
@@ -125,7 +130,7 @@ async def get_status(request: Request):
     token = get_plex_token(request)
     
     try:
-        plex = plex_service.connect(token)
+        plex = await plex_service.connect_async(token)
         return {
             "connected": True,
             "server_name": plex.friendlyName,
@@ -148,16 +153,19 @@ async def get_libraries(request: Request):
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        libraries = plex_service.get_tv_libraries(token)
+        libraries = await plex_service.get_tv_libraries_async(token)
+        show_counts = await asyncio.gather(
+            *(plex_service.get_library_size_async(lib) for lib in libraries)
+        )
         return {
             "libraries": [
                 {
                     "key": lib.key,
                     "title": lib.title,
                     "uuid": lib.uuid,
-                    "show_count": len(lib.all())
+                    "show_count": show_count
                 }
-                for lib in libraries
+                for lib, show_count in zip(libraries, show_counts)
             ]
         }
     except Exception as e:
@@ -185,50 +193,56 @@ async def get_shows(
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        shows = plex_service.get_all_shows(library, token)
-        
-        # Apply pagination
-        total_count = len(shows)
-        if offset:
-            shows = shows[offset:]
-        if limit:
-            shows = shows[:limit]
-        
         if fast_mode:
-            # Fast mode: Return basic info only, no episode/season counts
+            # Fast mode: Return basic info only, no episode/season counts.
+            # Only the requested page is fetched, via Plex's JSON API.
+            total_count, shows = await plex_service.get_shows_page_async(library, token, offset, limit or None)
             return {
                 "count": total_count,
                 "offset": offset,
                 "shows": [
                     {
-                        "id": show.ratingKey,
-                        "title": show.title,
-                        "year": show.year,
-                        "thumb": plex_service.get_full_image_url(show.thumb, token),
+                        "id": show['ratingKey'],
+                        "title": show['title'],
+                        "year": show['year'],
+                        "thumb": plex_service.get_full_image_url(show['thumb'], token),
                         "episode_count": 0,  # Placeholder, will be loaded separately
                         "season_count": 0,   # Placeholder, will be loaded separately
-                        "summary": getattr(show, 'summary', '')[:200] if hasattr(show, 'summary') else ''
-                    }
-                    for show in shows
-                ]
-            }
-        else:
-            # Full mode: Include episode and season counts (slower)
-            return {
-                "count": total_count,
-                "offset": offset,
-                "shows": [
-                    {
-                        "id": show.ratingKey,
-                        "title": show.title,
-                        "year": show.year,
-                        "thumb": plex_service.get_full_image_url(show.thumb, token),
-                        "episode_count": len(show.episodes()),
-                        "season_count": len(show.seasons())
+                        "summary": show['summary'][:200]
                     }
                     for show in shows
                 ]
             }
+        
+        shows = await plex_service.get_all_shows_async(library, token)
+        
+        # Apply pagination
+        total_count = len(shows)
+        if offset:
+            shows = shows[offset:]
+        if limit:
+            shows = shows[:limit]
+        
+        # Full mode: Include episode and season counts (slower)
+        counts = await asyncio.gather(*(
+            asyncio.gather(plex_service.get_episodes_async(show), plex_service.get_seasons_async(show))
+            for show in shows
+        ))
+        return {
+            "count": total_count,
+            "offset": offset,
+            "shows": [
+                {
+                    "id": show.ratingKey,
+                    "title": show.title,
+                    "year": show.year,
+                    "thumb": plex_service.get_full_image_url(show.thumb, token),
+                    "episode_count": len(episodes),
+                    "season_count": len(seasons)
+                }
+                for show, (episodes, seasons) in zip(shows, counts)
+            ]
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -255,8 +269,7 @@ async def get_shows_with_languages(
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        plex = plex_service.connect(token)
-        shows = plex_service.get_all_shows(library, token)
+        shows = await plex_service.get_all_shows_async(library, token)
         
         # Parse requested languages
         requested_languages = []
@@ -267,8 +280,9 @@ async def get_shows_with_languages(
         
         for show in shows:
             try:
+                episodes = await plex_service.get_episodes_async(show)
                 # Check if show has subtitle files for requested languages
-                if not requested_languages or has_subtitle_languages(show, requested_languages, plex):
+                if not requested_languages or has_subtitle_languages(show, episodes, requested_languages):
                     show_data = {
                         "id": str(show.ratingKey),
                         "title": show.title,
@@ -276,9 +290,9 @@ async def get_shows_with_languages(
                         "summary": show.summary,
                         "thumb": plex_service.get_full_image_url(show.thumb, token),
                         "art": plex_service.get_full_image_url(show.art, token),
-                        "episode_count": len(show.episodes()) if not requested_languages else None,  # Skip expensive ops when filtering
-                        "season_count": len(show.seasons()) if not requested_languages else None,
-                        "available_languages": get_show_subtitle_languages(show, plex) if requested_languages else []
+                        "episode_count": len(episodes) if not requested_languages else None,  # Skip expensive ops when filtering
+                        "season_count": len(await plex_service.get_seasons_async(show)) if not requested_languages else None,
+                        "available_languages": get_show_subtitle_languages(show, episodes) if requested_languages else []
                     }
                     filtered_shows.append(show_data)
                     
@@ -302,10 +316,10 @@ async def get_shows_with_languages(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def has_subtitle_languages(show, requested_languages: list, plex) -> bool:
+def has_subtitle_languages(show, episodes: list, requested_languages: list) -> bool:
     """Check if a show has subtitle files for all requested languages"""
     try:
-        available_languages = get_show_subtitle_languages(show, plex)
+        available_languages = get_show_subtitle_languages(show, episodes)
         available_codes = [lang.lower() for lang in available_languages]
         
         # Check if all requested languages are available
@@ -314,17 +328,14 @@ def has_subtitle_languages(show, requested_languages: list, plex) -> bool:
         return False
 
 
-def get_show_subtitle_languages(show, plex) -> list:
+def get_show_subtitle_languages(show, episodes: list) -> list:
     """Extract subtitle languages from a show's episodes"""
-    import os
-    import re
-    
     languages = set()
     
     try:
-        # Get first few episodes to sample subtitle languages (for performance)
-        episodes = show.episodes()[:3]  # Sample first 3 episodes
-        print(f"DEBUG: Checking {len(episodes)} episodes for show: {show.title}")
+        # Sample the first few episodes' folders (for performance)
+        episodes = episodes[:3]
+        logger.debug("Checking %d episodes for show: %s", len(episodes), show.title)
         
         for episode in episodes:
             if not hasattr(episode, 'media') or not episode.media:
@@ -335,40 +346,38 @@ def get_show_subtitle_languages(show, plex) -> list:
                     if hasattr(part, 'file') and part.file:
                         # Get directory path
                         episode_dir = os.path.dirname(part.file)
-                        print(f"DEBUG: Checking directory: {episode_dir}")
+                        logger.debug("Checking directory: %s", episode_dir)
                         
                         try:
                             # Look for subtitle files in the episode directory
                             if os.path.exists(episode_dir):
                                 subtitle_files = [f for f in os.listdir(episode_dir) 
-                                                if f.lower().endswith(('.srt', '.ass', '.vtt', '.sub', '.ssa'))]
-                                print(f"DEBUG: Found subtitle files: {subtitle_files}")
+                                                if os.path.splitext(f)[1].lower() in SUBTITLE_EXTENSIONS]
+                                logger.debug("Found subtitle files: %s", subtitle_files)
                                 
                                 for filename in subtitle_files:
                                     # Extract language codes from filename
                                     detected_langs = extract_languages_from_filename(filename)
-                                    print(f"DEBUG: File '{filename}' -> detected languages: {detected_langs}")
+                                    logger.debug("File '%s' -> detected languages: %s", filename, detected_langs)
                                     languages.update(detected_langs)
                             else:
-                                print(f"DEBUG: Directory doesn't exist: {episode_dir}")
+                                logger.debug("Directory doesn't exist: %s", episode_dir)
                         except (OSError, PermissionError) as e:
                             # Directory not accessible or doesn't exist
-                            print(f"DEBUG: Cannot access directory {episode_dir}: {e}")
+                            logger.debug("Cannot access directory %s: %s", episode_dir, e)
                             continue
     except Exception as e:
         print(f"Error getting subtitle languages for {show.title}: {e}")
     
     final_languages = list(languages)
-    print(f"DEBUG: Final detected languages for {show.title}: {final_languages}")
+    logger.debug("Final detected languages for %s: %s", show.title, final_languages)
     return final_languages
 
 
-def extract_languages_from_filename(filename: str) -> list:
-    """Extract language codes from subtitle filename"""
-    import re
-    
-    # Common language patterns in subtitle filenames
-    language_patterns = {
+# Common language patterns in subtitle filenames
+LANGUAGE_PATTERNS = {
+    lang_code: re.compile(pattern)
+    for lang_code, pattern in {
         'en': r'\b(en|eng|english)\b',
         'zh': r'\b(zh|chi|chinese|chs)\b', 
         'zh-hant': r'\b(zh-tw|zh-hk|zht|cht|tc|traditional)\b',
@@ -383,13 +392,17 @@ def extract_languages_from_filename(filename: str) -> list:
         'ar': r'\b(ar|ara|arabic)\b',
         'it': r'\b(it|ita|italian)\b',
         'nl': r'\b(nl|dut|nld|dutch)\b'
-    }
-    
+    }.items()
+}
+
+
+def extract_languages_from_filename(filename: str) -> list:
+    """Extract language codes from subtitle filename"""
     filename_lower = filename.lower()
     detected_languages = []
     
-    for lang_code, pattern in language_patterns.items():
-        if re.search(pattern, filename_lower):
+    for lang_code, pattern in LANGUAGE_PATTERNS.items():
+        if pattern.search(filename_lower):
             detected_languages.append(lang_code)
     
     return detected_languages
@@ -413,11 +426,15 @@ async def get_show_counts(show_id: str, request: Request):
                 return cached_data['data']
         
         # Fetch from Plex if not in cache or expired
-        show = plex_service.get_show(show_id, token)
+        show = await plex_service.get_show_async(show_id, token)
+        episodes, seasons = await asyncio.gather(
+            plex_service.get_episodes_async(show),
+            plex_service.get_seasons_async(show)
+        )
         result = {
             "id": show.ratingKey,
-            "episode_count": len(show.episodes()),
-            "season_count": len(show.seasons())
+            "episode_count": len(episodes),
+            "season_count": len(seasons)
         }
         
         # Store in cache
@@ -439,24 +456,31 @@ async def get_show_detail(show_id: str, request: Request):
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        show = plex_service.get_show(show_id, token)
+        # Get the show and all its episodes (with stream details) in parallel
+        show, episodes = await asyncio.gather(
+            plex_service.get_show_async(show_id, token),
+            plex_service.get_show_episodes_bulk_async(show_id, token)
+        )
+        seasons = await plex_service.get_seasons_async(show)
+        
+        # Check subtitle status
+        episode_list = await plex_service.format_episodes_async(episodes, token)
         
-        # Get all episodes and check subtitle status
-        episodes = show.episodes()
         episodes_with_subs = 0
         total_external_subs = 0
         total_embedded_subs = 0
-        
-        episode_list = []
-        for episode in episodes:
-            file_info = plex_service.get_episode_file_info(episode)
+        for episode_info in episode_list:
+            file_info = episode_info['file_info']
             if file_info:
                 if file_info['has_subtitles']:
                     episodes_with_subs += 1
                 total_external_subs += len(file_info.get('external_subtitles', []))
                 total_embedded_subs += len(file_info.get('embedded_subtitles', []))
-            
-            episode_list.append(plex_service.format_episode_info(episode, token))
+        
+        # Count episodes per season from the list we already have
+        season_episode_counts: Dict[Any, int] = {}
+        for episode in episodes:
+            season_episode_counts[episode.parentRatingKey] = season_episode_counts.get(episode.parentRatingKey, 0) + 1
         
         return {
             "id": show.ratingKey,
@@ -466,7 +490,7 @@ async def get_show_detail(show_id: str, request: Request):
             "thumb": plex_service.get_full_image_url(show.thumb, token),
             "art": plex_service.get_full_image_url(show.art, token),
             "episode_count": len(episodes),
-            "season_count": len(show.seasons()),
+            "season_count": len(seasons),
             "episodes_with_subtitles": episodes_with_subs,
             "subtitle_coverage": f"{(episodes_with_subs/len(episodes)*100):.1f}%" if episodes else "0%",
             "total_external_subtitles": total_external_subs,
@@ -476,9 +500,9 @@ async def get_show_detail(show_id: str, request: Request):
                     "id": season.ratingKey,
                     "index": season.index,
                     "title": season.title,
-                    "episode_count": len(season.episodes())
+                    "episode_count": season_episode_counts.get(season.ratingKey, 0)
                 }
-                for season in show.seasons()
+                for season in seasons
             ],
             "episodes": episode_list
         }
@@ -486,18 +510,21 @@ async def get_show_detail(show_id: str, request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/episodes/{episode_id}")
-async def get_episode_detail(episode_id: str, request: Request):
-    """Get detailed information about a specific episode"""
+async def get_episode_detail(episode_id: str, request: Request, refresh: bool = False):
+    """Get detailed information about a specific episode
+    
+    Args:
+        refresh: If True, re-read embedded subtitle streams instead of using the cache
+    """
     token = get_plex_token(request)
     
     if not token:
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        plex = plex_service.connect(token)
-        episode = plex.fetchItem(int(episode_id))
+        episode = await plex_service.get_episode_async(episode_id, token)
         
-        return plex_service.format_episode_info(episode, token)
+        return await plex_service.format_episode_info_async(episode, token, refresh)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -510,10 +537,9 @@ async def get_episode_subtitles(episode_id: str, request: Request):
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        plex = plex_service.connect(token)
-        episode = plex.fetchItem(int(episode_id))
+        episode = await plex_service.get_episode_async(episode_id, token)
         
-        file_info = plex_service.get_episode_file_info(episode)
+        file_info = await plex_service.get_episode_file_info_async(episode)
         
         if not file_info:
             return {
@@ -528,7 +554,7 @@ async def get_episode_subtitles(episode_id: str, request: Request):
             "has_subtitles": file_info['has_subtitles'],
             "embedded_subtitles": file_info['embedded_subtitles'],
             "external_subtitles": file_info['external_subtitles'],
-            "naming_pattern": plex_service.get_episode_naming_pattern(episode)
+            "naming_pattern": file_info['file_name']
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -548,23 +574,21 @@ async def upload_subtitle(
     
     try:
         # Get episode information
-        plex = plex_service.connect(token)
-        episode = plex.fetchItem(int(episode_id))
-        
-        # Get the naming pattern
-        base_name = plex_service.get_episode_naming_pattern(episode)
+        episode = await plex_service.get_episode_async(episode_id, token)
         
         # Validate file extension
-        allowed_extensions = ['.srt', '.ass', '.ssa', '.vtt', '.sub']
         file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in allowed_extensions:
-            raise HTTPException(400, f"Invalid file type. Allowed: {', '.join(allowed_extensions)}")
+        if file_ext not in SUBTITLE_EXTENSIONS:
+            raise HTTPException(400, f"Invalid file type. Allowed: {', '.join(sorted(SUBTITLE_EXTENSIONS))}")
         
         # Get the directory where the video file is
-        file_info = plex_service.get_episode_file_info(episode)
+        file_info = await plex_service.get_episode_file_info_async(episode)
         if not file_info:
             raise HTTPException(404, "Episode file not found")
         
+        # The video file's stem is the naming pattern Plex matches against
+        base_name = file_info['file_name']
+        
         # Create the subtitle filename following Plex convention
         subtitle_filename = f"{base_name}.{language}{file_ext}"
         subtitle_path = Path(file_info['file_dir']) / subtitle_filename
@@ -596,7 +620,7 @@ async def delete_subtitle(file_path: str):
         path = Path(file_path)
         
         # Security check - ensure it's a subtitle file
-        if path.suffix.lower() not in ['.srt', '.ass', '.ssa', '.vtt', '.sub']:
+        if path.suffix.lower() not in SUBTITLE_EXTENSIONS:
             raise HTTPException(400, "Can only delete subtitle files")
         
         if not path.exists():
@@ -609,6 +633,7 @@ async def delete_subtitle(file_path: str):
         
         # Delete the file
         path.unlink()
+        subtitle_service.clear_cache()
         
         return {
             "success": True,
@@ -645,8 +670,7 @@ async def create_dual_subtitle(
     
     try:
         # Get episode information
-        plex = plex_service.connect(token)
-        episode = plex.fetchItem(int(episode_id))
+        episode = await plex_service.get_episode_async(episode_id, token)
         
         # Validate subtitle files exist
         primary_path = Path(primary_subtitle)
@@ -658,11 +682,11 @@ async def create_dual_subtitle(
             raise HTTPException(404, f"Secondary subtitle not found: {secondary_subtitle}")
         
         # Get output path
-        file_info = plex_service.get_episode_file_info(episode)
+        file_info = await plex_service.get_episode_file_info_async(episode)
         if not file_info:
             raise HTTPException(404, "Episode file not found")
         
-        base_name = plex_service.get_episode_naming_pattern(episode)
+        base_name = file_info['file_name']
         output_ext = '.ass' if output_format == 'ass' else '.srt'
         
         # Use language detection for filename if available
@@ -841,10 +865,9 @@ async def extract_embedded_subtitle(
     
     try:
         # Get episode information
-        plex = plex_service.connect(token)
-        episode = plex.fetchItem(int(episode_id))
+        episode = await plex_service.get_episode_async(episode_id, token)
         
-        file_info = plex_service.get_episode_file_info(episode)
+        file_info = await plex_service.get_episode_file_info_async(episode)
         if not file_info:
             raise HTTPException(404, "Episode file not found")
         
@@ -862,7 +885,7 @@ async def extract_embedded_subtitle(
             file_ext = '.srt'  # Default to SRT for compatibility
         
         # Create output filename
-        base_name = plex_service.get_episode_naming_pattern(episode)
+        base_name = file_info['file_name']
         suffix = ".forced" if subtitle_type == "forced" else ""
         output_filename = f"{base_name}.{language_code}{suffix}{file_ext}"
         output_path = Path(file_info['file_dir']) / output_filename
@@ -898,8 +921,7 @@ async def debug_episode_streams(episode_id: str, request: Request):
         raise HTTPException(status_code=401, detail="Plex authentication required")
     
     try:
-        plex = plex_service.connect(token)
-        episode = plex.fetchItem(int(episode_id))
+        episode = await plex_service.get_episode_async(episode_id, token)
         
         if not episode.media:
             return {"error": "No media found"}
@@ -946,7 +968,7 @@ async def proxy_plex_image(path: str, request: Request, token: Optional[str] = N
     
     try:
         # Connect to Plex and get the proper server URL
-        plex = plex_service.connect(auth_token)
+        plex = await plex_service.connect_async(auth_token)
         
         # Construct the full image URL
         image_url = f"{plex._baseurl}/{path}"
@@ -9,9 +9,14 @@ from dataclasses import dataclass
 from enum import Enum
 
 import pysubs2
-from langdetect import detect, LangDetectException
+from langdetect import detect, detect_langs, LangDetectException
 import chardet
 
+try:
+    import cld3  # Optional: pycld3 is much faster than langdetect
+except ImportError:
+    cld3 = None
+
 import sys
 from pathlib import Path
 # Add backend directory to path
@@ -19,8 +24,9 @@ backend_dir = Path(__file__).parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
-from exceptions import LanguageDetectionError, SubtitleEncodingError
+from exceptions import LanguageDetectionError
 from config import settings
+from compat import DATACLASS_SLOTS
 
 
 class Language(Enum):
@@ -39,7 +45,7 @@ class Language(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LanguageDetectionResult:
     """Result of language detection"""
     detected_language: Language
@@ -67,19 +73,46 @@ class SimpleLanguageDetector:
     # Characters more common in Simplified Chinese
     SIMPLIFIED_INDICATORS = set('简体国际电脑网络软体记忆体处理器图画机器学习训练测试数据库连线')
     
+    # Separator used when joining samples for a single grouped detection
+    SAMPLE_SEPARATOR = '\n'
+    
+    # Map langdetect/cld3 codes to our Language enum
+    LIBRARY_LANG_MAP = {
+        'en': Language.ENGLISH,
+        'ja': Language.JAPANESE,
+        'zh-cn': Language.CHINESE_SIMPLIFIED,
+        'zh-tw': Language.CHINESE_TRADITIONAL,
+        'ko': Language.KOREAN,
+        'fr': Language.FRENCH,
+        'es': Language.SPANISH,
+        'de': Language.GERMAN,
+        'ru': Language.RUSSIAN,
+        'it': Language.ITALIAN,
+        'pt': Language.PORTUGUESE,
+    }
+    
     def __init__(self):
         self.min_sample_size = 100  # Minimum characters for reliable detection
         self.max_sample_lines = 50  # Maximum subtitle lines to sample
     
-    def detect_encoding(self, file_path: Path) -> str:
-        """Detect file encoding"""
+    def detect_encoding(self, file_path: Path) -> Optional[str]:
+        """Detect file encoding, returning None if it cannot be determined"""
+        # Feed the detector in 32 KB chunks and stop as soon as it is confident;
+        # a bare prefix is not enough since ASCII-only heads say nothing about
+        # the accented lines further down
+        detector = chardet.UniversalDetector()
         try:
             with open(file_path, 'rb') as f:
-                raw_data = f.read()
-                result = chardet.detect(raw_data)
-                return result['encoding'] or 'utf-8'
-        except Exception as e:
-            raise SubtitleEncodingError(str(file_path))
+                for chunk in iter(lambda: f.read(32768), b''):
+                    detector.feed(chunk)
+                    if detector.done:
+                        break
+        except OSError:
+            # Let the caller pick a fallback; loading will surface the real error
+            return None
+        
+        detector.close()
+        return detector.result['encoding']
     
     def detect_from_file(self, file_path: Path, declared_lang: Optional[str] = None) -> LanguageDetectionResult:
         """
@@ -104,7 +137,7 @@ class SimpleLanguageDetector:
         
         try:
             # Load subtitle file
-            encoding = self.detect_encoding(file_path)
+            encoding = self.detect_encoding(file_path) or 'utf-8'
             subs = pysubs2.load(str(file_path), encoding=encoding)
             
             if not subs:
@@ -266,47 +299,123 @@ class SimpleLanguageDetector:
         )
     
     def _detect_with_library(self, text: str) -> Optional[LanguageDetectionResult]:
-        """Detect language using langdetect library"""
+        """Detect language using cld3 when available, otherwise langdetect"""
+        
+        if cld3 is not None and settings.app.enable_cld3:
+            return self._detect_with_cld3(text)
         
         try:
             detected = detect(text)
-            
-            # Map langdetect codes to our Language enum
-            lang_map = {
-                'en': Language.ENGLISH,
-                'ja': Language.JAPANESE,
-                'zh-cn': Language.CHINESE_SIMPLIFIED,
-                'zh-tw': Language.CHINESE_TRADITIONAL,
-                'ko': Language.KOREAN,
-                'fr': Language.FRENCH,
-                'es': Language.SPANISH,
-                'de': Language.GERMAN,
-                'ru': Language.RUSSIAN,
-                'it': Language.ITALIAN,
-                'pt': Language.PORTUGUESE,
-            }
-            
-            # Handle Chinese detection (langdetect returns 'zh-cn' or 'zh-tw' sometimes, 'zh' others)
-            if detected == 'zh':
-                # Need to determine variant
-                return LanguageDetectionResult(
-                    detected_language=Language.CHINESE_SIMPLIFIED,  # Default to simplified
-                    confidence=0.7,
-                    method_used="langdetect",
-                    details={"raw_detection": detected}
-                )
-            
-            language = lang_map.get(detected, Language.UNKNOWN)
-            
+        except LangDetectException:
+            return None
+        
+        # Handle Chinese detection (langdetect returns 'zh-cn' or 'zh-tw' sometimes, 'zh' others)
+        if detected == 'zh':
+            # Need to determine variant
             return LanguageDetectionResult(
-                detected_language=language,
-                confidence=0.8 if language != Language.UNKNOWN else 0.3,
+                detected_language=Language.CHINESE_SIMPLIFIED,  # Default to simplified
+                confidence=0.7,
                 method_used="langdetect",
                 details={"raw_detection": detected}
             )
-            
-        except LangDetectException:
+        
+        language = self.LIBRARY_LANG_MAP.get(detected, Language.UNKNOWN)
+        
+        return LanguageDetectionResult(
+            detected_language=language,
+            confidence=0.8 if language != Language.UNKNOWN else 0.3,
+            method_used="langdetect",
+            details={"raw_detection": detected}
+        )
+    
+    def _detect_with_cld3(self, text: str) -> Optional[LanguageDetectionResult]:
+        """Detect language using Google's cld3 (native extension)"""
+        
+        prediction = cld3.get_language(text)
+        if prediction is None or prediction.language == 'und':
             return None
+        
+        language = self._map_library_code(prediction.language)
+        
+        if language == Language.UNKNOWN:
+            confidence = 0.3
+        elif not prediction.is_reliable:
+            confidence = 0.5
+        elif language == Language.CHINESE_SIMPLIFIED:
+            confidence = 0.7
+        else:
+            confidence = 0.8
+        
+        return LanguageDetectionResult(
+            detected_language=language,
+            confidence=confidence,
+            method_used="cld3",
+            details={
+                "raw_detection": prediction.language,
+                "probability": prediction.probability
+            }
+        )
+    
+    def _map_library_code(self, code: str) -> Language:
+        """Map a langdetect/cld3 language code to our Language enum"""
+        
+        code = code.lower()
+        if code in self.LIBRARY_LANG_MAP:
+            return self.LIBRARY_LANG_MAP[code]
+        
+        # Plain 'zh' (or cld3's 'zh-Latn' for pinyin); the variant is refined later
+        if code.startswith('zh'):
+            return Language.CHINESE_SIMPLIFIED
+        
+        return Language.UNKNOWN
+    
+    def detect_many(self, samples: List[str]) -> List[Language]:
+        """
+        Detect the language of several text samples expected to share a language
+        
+        Callers group samples by their declared language (e.g. the Plex language
+        tag) so the whole group can be detected with a single library call. If
+        the combined text turns out to be mixed, each sample is detected on its own.
+        
+        Args:
+            samples: Text samples, typically one per subtitle file
+            
+        Returns:
+            Detected Language for each sample, in input order
+        """
+        
+        if not samples:
+            return []
+        
+        language = self._detect_group_language(self.SAMPLE_SEPARATOR.join(samples), len(samples))
+        if language is not None:
+            return [language] * len(samples)
+        
+        results = []
+        for sample in samples:
+            result = self._detect_with_library(sample)
+            results.append(result.detected_language if result else Language.UNKNOWN)
+        return results
+    
+    def _detect_group_language(self, text: str, group_size: int) -> Optional[Language]:
+        """Detect the single dominant language of combined samples, or None if mixed"""
+        
+        if cld3 is not None and settings.app.enable_cld3:
+            predictions = cld3.get_frequent_languages(text, num_langs=group_size)
+            significant = [p for p in predictions if p.proportion >= 0.1]
+            if len(significant) != 1 or not significant[0].is_reliable:
+                return None
+            code = significant[0].language
+        else:
+            try:
+                predictions = detect_langs(text)
+            except LangDetectException:
+                return None
+            if not predictions or predictions[0].prob < 0.9:
+                return None
+            code = predictions[0].lang
+        
+        return self._map_library_code(code)
     
     def _refine_chinese_detection(self, text: str, initial_result: LanguageDetectionResult) -> LanguageDetectionResult:
         """Refine detection between Simplified and Traditional Chinese"""
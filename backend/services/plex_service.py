@@ -3,14 +3,95 @@ Plex API Service - handles all interactions with Plex Media Server
 """
 
 import os
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from plexapi.exceptions import BadRequest
 from plexapi.server import PlexServer
 from plexapi.library import ShowSection
 from plexapi.video import Show, Episode
 from dotenv import load_dotenv
 
+__all__ = ["PlexService", "plex_service", "SUBTITLE_EXTENSIONS"]
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+SUBTITLE_EXTENSIONS = frozenset({'.srt', '.ass', '.ssa', '.vtt', '.sub'})
+SUBTITLE_SUFFIXES = tuple(SUBTITLE_EXTENSIONS)  # For str.endswith
+
+# Deletes every ASCII character that isn't alphanumeric, space, '-' or '_'
+_SAFE_TITLE_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in ' -_')
+))
+
+# Trailing 2-3 letter language code on a subtitle stem, e.g. "Show.S01E01.en"
+LANGUAGE_SUFFIX_RE = re.compile(r'\.([^\W\d_]{2,3})$')
+
+# plexapi formats HTTP errors as "(status) codename; url ..."
+_STATUS_RE = re.compile(r'^\((\d{3})\)')
+
+
+# Marks threads already inside PlexService._call_with_retry, so nested
+# wrappers pass straight through and only the outermost call retries
+_retry_scope = threading.local()
+
+
+def _retryable_status(error: BadRequest) -> Optional[int]:
+    """Return the HTTP status of a throttling/server error, or None"""
+    match = _STATUS_RE.match(str(error))
+    if match:
+        status = int(match.group(1))
+        if status == 429 or status >= 500:
+            return status
+    return None
+
+
+def _season_episode_code(season, episode) -> str:
+    """Format an SxxEyy code, tolerating missing indexes"""
+    try:
+        return f"S{season:02d}E{episode:02d}"
+    except (TypeError, ValueError):
+        return f"S{str(season).zfill(2)}E{str(episode).zfill(2)}"
+
+
+def _token_hash(token: str) -> str:
+    """Stable, collision-resistant cache key for a Plex token"""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
 class PlexService:
+    # Retry policy for outbound Plex calls
+    RETRY_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+    
+    # How long plex.tv account lookups and discovered server URLs are reused
+    DISCOVERY_CACHE_TTL = 24 * 3600
+    
+    # Embedded stream cache limits
+    EMBEDDED_CACHE_TTL = 3600
+    EMBEDDED_CACHE_SIZE = 20000
+    
+    # (connect, read) timeouts for Plex HTTP requests
+    HTTP_TIMEOUT = (3.05, 30)
+    
+    # Items per request when paging through JSON listings
+    JSON_PAGE_SIZE = 500
+    
     def __init__(self):
         load_dotenv()
         # Fallback to .env for backward compatibility, but prefer dynamic tokens
@@ -18,6 +99,44 @@ class PlexService:
         self.fallback_token = os.getenv('PLEX_TOKEN')
         self.tv_library_name = os.getenv('PLEX_TV_LIBRARY', 'TV Shows')
         self._connection_cache = {}  # Cache connections per token
+        # Library sections per (token hash, library name or None for the default)
+        self._section_cache: Dict[Tuple[str, Optional[str]], ShowSection] = {}
+        # plex.tv lookups per token hash: {hash: (stored_at, value)}
+        self._account_cache: Dict[str, Tuple[float, object]] = {}
+        self._discovered_url_cache: Dict[str, Tuple[float, str]] = {}
+        # Subtitle files per directory, keyed by the directory's mtime so
+        # uploads/deletes invalidate the entry: {dir: (mtime_ns, [names])}
+        self._dir_cache: Dict[str, Tuple[int, List[str]]] = {}
+        # Embedded subtitle streams per (ratingKey, updatedAt): {key: (stored_at, [subs])}
+        self._embedded_cache: Dict[Tuple, Tuple[float, List[Dict]]] = {}
+        
+        # One pooled HTTP session shared by every PlexServer so keep-alive
+        # connections are reused instead of re-handshaking per connection.
+        # No adapter-level retries: _call_with_retry is the only retry layer
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=0
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        
+        # Bounded pool for blocking plexapi calls made from async endpoints
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('PLEX_IO_WORKERS', '16')),
+            thread_name_prefix="plex_io"
+        )
+        # Separate pool for directory scans so slow network mounts don't
+        # starve Plex API calls (and vice versa)
+        self._fs_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv('PLEX_FS_WORKERS', '16')),
+            thread_name_prefix="plex_fs"
+        )
+        # Caps in-flight Plex requests so fan-out doesn't overload the server.
+        # Created lazily so it binds to the running event loop.
+        self._concurrency = int(os.getenv('PLEX_CONCURRENCY', '8'))
+        self._gate: Optional[asyncio.Semaphore] = None
         
     def connect(self, token: Optional[str] = None, server_url: Optional[str] = None) -> PlexServer:
         """Connect to Plex server using provided or fallback credentials"""
@@ -29,7 +148,7 @@ class PlexService:
             raise Exception("No Plex authentication token provided")
         
         # Use cached connection if available
-        cache_key = f"{plex_url}:{auth_token[:10]}"  # Partial token for cache key
+        cache_key = f"{plex_url}:{_token_hash(auth_token)}"
         if cache_key in self._connection_cache:
             return self._connection_cache[cache_key]
         
@@ -41,33 +160,57 @@ class PlexService:
             raise Exception("No Plex server URL available. Please configure PLEX_URL in .env")
             
         # Create new connection
-        plex = PlexServer(plex_url, auth_token)
+        plex = self._call_with_retry(
+            PlexServer, plex_url, auth_token, session=self._http, timeout=self.HTTP_TIMEOUT
+        )
         
         # Cache the connection
         self._connection_cache[cache_key] = plex
         
         return plex
     
+    def _get_account(self, token: str):
+        """Get the MyPlexAccount for a token, reusing it for DISCOVERY_CACHE_TTL"""
+        from plexapi.myplex import MyPlexAccount
+        
+        key = _token_hash(token)
+        cached = self._account_cache.get(key)
+        if cached and time.time() - cached[0] < self.DISCOVERY_CACHE_TTL:
+            return cached[1]
+        
+        account = MyPlexAccount(token=token, session=self._http)
+        self._account_cache[key] = (time.time(), account)
+        return account
+    
     def _discover_server_url(self, token: str) -> Optional[str]:
         """Discover server URL from MyPlex account using token"""
+        key = _token_hash(token)
+        cached = self._discovered_url_cache.get(key)
+        if cached and time.time() - cached[0] < self.DISCOVERY_CACHE_TTL:
+            return cached[1]
+        
         try:
-            from plexapi.myplex import MyPlexAccount
-            account = MyPlexAccount(token=token)
+            account = self._get_account(token)
             
             # Get servers
             servers = account.resources()
             plex_servers = [s for s in servers if s.product == 'Plex Media Server' and s.presence]
             
+            url = None
             if plex_servers:
                 # Prefer local connections
-                for server in plex_servers:
-                    for conn in server.connections:
-                        if conn.local:
-                            return conn.uri
+                url = next(
+                    (conn.uri for server in plex_servers for conn in server.connections if conn.local),
+                    None
+                )
                 
                 # Fall back to any connection
-                if plex_servers[0].connections:
-                    return plex_servers[0].connections[0].uri
+                if not url and plex_servers[0].connections:
+                    url = plex_servers[0].connections[0].uri
+            
+            if url:
+                self._discovered_url_cache[key] = (time.time(), url)
+            return url
         except Exception as e:
             print(f"Failed to discover server URL: {e}")
         
@@ -80,7 +223,17 @@ class PlexService:
         return [lib for lib in libraries if lib.type == 'show']
     
     def get_tv_library(self, library_name: Optional[str] = None, token: Optional[str] = None) -> ShowSection:
-        """Get specific TV library by name"""
+        """Get specific TV library by name (cached per token and name)"""
+        auth_token = token or self.fallback_token or ''
+        cache_key = (_token_hash(auth_token), library_name)
+        section = self._section_cache.get(cache_key)
+        if section is None:
+            section = self._resolve_tv_library(library_name, token)
+            self._section_cache[cache_key] = section
+        return section
+    
+    def _resolve_tv_library(self, library_name: Optional[str] = None, token: Optional[str] = None) -> ShowSection:
+        """Look up a TV library by name, falling back to the default or first TV library"""
         plex = self.connect(token)
         
         if library_name:
@@ -108,6 +261,57 @@ class PlexService:
         library = self.get_tv_library(library_name, token)
         return library.all()
     
+    def _json_get(self, plex: PlexServer, path: str, headers: Optional[Dict] = None, **params) -> Dict:
+        """GET a Plex endpoint as JSON over the pooled session, bypassing plexapi's XML parsing"""
+        request_headers = {"Accept": "application/json", "X-Plex-Token": plex._token}
+        if headers:
+            request_headers.update(headers)
+        response = self._http.get(
+            plex.url(path), headers=request_headers, params=params, timeout=self.HTTP_TIMEOUT
+        )
+        if not response.ok:
+            # Same message format as plexapi so retry handling treats both alike
+            codename = requests.status_codes._codes.get(response.status_code, ['Unknown'])[0]
+            raise BadRequest(f"({response.status_code}) {codename}; {response.url}")
+        return _json_loads(response.content).get('MediaContainer', {})
+    
+    def get_shows_page(self, library_name: Optional[str] = None, token: Optional[str] = None,
+                       offset: int = 0, limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """Get a page of shows as plain dicts via the JSON API
+        
+        Only the requested window is fetched from Plex. Returns (total_count, shows).
+        """
+        library = self.get_tv_library(library_name, token)
+        plex = library._server
+        path = f"/library/sections/{library.key}/all"
+        
+        shows = []
+        total_count = 0
+        start = offset
+        while limit is None or len(shows) < limit:
+            size = self.JSON_PAGE_SIZE if limit is None else min(self.JSON_PAGE_SIZE, limit - len(shows))
+            container = self._call_with_retry(
+                self._json_get, plex, path,
+                headers={"X-Plex-Container-Start": str(start), "X-Plex-Container-Size": str(size)}
+            )
+            items = container.get('Metadata', [])
+            total_count = container.get('totalSize', start + len(items))
+            shows.extend(
+                {
+                    'ratingKey': int(item['ratingKey']),
+                    'title': item.get('title', ''),
+                    'year': item.get('year'),
+                    'thumb': item.get('thumb'),
+                    'summary': item.get('summary') or ''
+                }
+                for item in items
+            )
+            start += len(items)
+            if len(items) < size or start >= total_count:
+                break
+        
+        return total_count, shows
+    
     def get_full_image_url(self, relative_url: str, token: Optional[str] = None, server_url: Optional[str] = None) -> str:
         """Convert relative Plex image URL to full URL with auth"""
         if not relative_url:
@@ -130,54 +334,36 @@ class PlexService:
         """Get all episodes for a show"""
         return show.episodes()
     
-    def get_episode_file_info(self, episode: Episode) -> Dict:
-        """Get file path and subtitle info for an episode"""
+    def get_show_episodes_bulk(self, show_id: str, token: Optional[str] = None) -> List[Episode]:
+        """Get all episodes for a show, including media parts and streams, in one request"""
+        plex = self.connect(token)
+        return plex.fetchItems(
+            f"/library/metadata/{int(show_id)}/allLeaves?checkFiles=0&includeMedia=1&includeStreams=1",
+            cls=Episode
+        )
+    
+    def get_episode_file_info(self, episode: Episode, refresh: bool = False) -> Dict:
+        """Get file path and subtitle info for an episode
+        
+        Embedded streams are cached per (ratingKey, updatedAt); pass refresh=True
+        to bypass the cache. External subtitles are always re-checked on disk.
+        """
         if not episode.media:
             return None
             
         media = episode.media[0]  # Get first media item (highest quality)
+        if not media.parts:
+            return None
         part = media.parts[0]  # Get first part (main file)
         
         file_path = part.file
-        file_dir = str(Path(file_path).parent)
-        file_name = Path(file_path).stem
+        if not file_path:
+            return None
+        path = Path(file_path)
+        file_dir = str(path.parent)
+        file_name = path.stem
         
-        # Get subtitle streams (embedded) - only truly embedded ones inside video file
-        embedded_subs = []
-        for stream in part.streams:
-            if stream.streamType == 3:  # Subtitle stream
-                stream_index = getattr(stream, 'index', -1)
-                stream_key = getattr(stream, 'key', None)
-                stream_id = getattr(stream, 'id', None)
-                
-                # More robust detection of embedded vs external subtitles
-                # Truly embedded subtitles typically have:
-                # - No key (or key is None)
-                # - Positive stream index
-                # - No external file reference
-                
-                # External subtitles added by Plex have:
-                # - A key like "/library/streams/xxxxx"
-                # - Often negative index or specific patterns
-                
-                is_truly_embedded = (
-                    stream_key is None and 
-                    stream_index >= 0 and
-                    not (hasattr(stream, 'url') and stream.url)  # No external URL
-                )
-                
-                
-                if is_truly_embedded:
-                    embedded_subs.append({
-                        'language': getattr(stream, 'language', 'Unknown'),
-                        'languageCode': getattr(stream, 'languageCode', ''),
-                        'codec': getattr(stream, 'codec', ''),
-                        'forced': getattr(stream, 'forced', False),
-                        'title': getattr(stream, 'title', ''),
-                        'stream_index': stream_index,  # Use actual Plex stream index
-                        'id': f"embedded_{stream_index}",
-                        'display_name': f"{getattr(stream, 'language', 'Unknown')} ({getattr(stream, 'codec', 'SUB')}){' - Forced' if getattr(stream, 'forced', False) else ''}"
-                    })
+        embedded_subs = self._get_embedded_subtitles(episode, part, refresh)
         
         # Check for external subtitles
         external_subs = self.find_external_subtitles(file_dir, file_name)
@@ -191,37 +377,115 @@ class PlexService:
             'has_subtitles': bool(embedded_subs or external_subs)
         }
     
+    @staticmethod
+    def _episode_file_path(episode: Episode) -> Optional[str]:
+        """Path of the episode's main media file, if it has one"""
+        if episode.media and episode.media[0].parts:
+            return episode.media[0].parts[0].file
+        return None
+    
+    def _get_embedded_subtitles(self, episode: Episode, part, refresh: bool = False) -> List[Dict]:
+        """Get subtitle streams (embedded) - only truly embedded ones inside video file"""
+        cache_key = (episode.ratingKey, getattr(episode, 'updatedAt', None))
+        now = time.time()
+        
+        if not refresh:
+            cached = self._embedded_cache.get(cache_key)
+            if cached and now - cached[0] < self.EMBEDDED_CACHE_TTL:
+                return cached[1]
+        
+        _getattr = getattr
+        embedded_subs = []
+        for stream in [s for s in part.streams if s.streamType == 3]:  # Subtitle streams
+            stream_index = _getattr(stream, 'index', -1)
+            
+            # More robust detection of embedded vs external subtitles
+            # Truly embedded subtitles typically have:
+            # - No key (or key is None)
+            # - Positive stream index
+            # - No external file reference
+            
+            # External subtitles added by Plex have:
+            # - A key like "/library/streams/xxxxx"
+            # - Often negative index or specific patterns
+            
+            is_truly_embedded = (
+                _getattr(stream, 'key', None) is None and
+                stream_index >= 0 and
+                not _getattr(stream, 'url', None)  # No external URL
+            )
+            
+            if is_truly_embedded:
+                language = _getattr(stream, 'language', 'Unknown')
+                codec = _getattr(stream, 'codec', '')
+                forced = _getattr(stream, 'forced', False)
+                embedded_subs.append({
+                    'language': language,
+                    'languageCode': _getattr(stream, 'languageCode', ''),
+                    'codec': codec,
+                    'forced': forced,
+                    'title': _getattr(stream, 'title', ''),
+                    'stream_index': stream_index,  # Use actual Plex stream index
+                    'id': f"embedded_{stream_index}",
+                    'display_name': f"{language} ({_getattr(stream, 'codec', 'SUB')}){' - Forced' if forced else ''}"
+                })
+        
+        # Listing results may omit streams entirely, so only cache when the
+        # episode was fetched individually or the listing included streams
+        if part.streams or episode.isFullObject():
+            if len(self._embedded_cache) >= self.EMBEDDED_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._embedded_cache.pop(next(iter(self._embedded_cache)), None)
+            self._embedded_cache[cache_key] = (now, embedded_subs)
+        
+        return embedded_subs
+    
+    def _list_subtitle_files(self, directory: str) -> List[str]:
+        """List subtitle file names in a directory, reusing the last scan if unchanged"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []  # Missing or unreachable directory
+        
+        cached = self._dir_cache.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        # scandir exposes the file type from the directory read itself,
+        # avoiding a stat per entry (expensive on network mounts)
+        names = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(SUBTITLE_SUFFIXES) and entry.is_file():
+                    names.append(entry.name)
+        self._dir_cache[directory] = (mtime, names)
+        return names
+    
     def find_external_subtitles(self, directory: str, base_filename: str) -> List[Dict]:
         """Find external subtitle files for a video file"""
         external_subs = []
-        subtitle_extensions = ['.srt', '.ass', '.ssa', '.vtt', '.sub']
+        min_stem_length = len(base_filename)
         
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
-                return external_subs
+            for name in self._list_subtitle_files(directory):
+                # Check if this subtitle belongs to our video
+                if not name.startswith(base_filename):
+                    continue
+                stem, _, ext = name.rpartition('.')
+                if len(stem) < min_stem_length:
+                    continue  # Prefix only matched by running into the extension
+                
+                # Extract language code if present
+                # Format: ShowName.S01E01.en.srt or ShowName.S01E01.srt
+                match = LANGUAGE_SUFFIX_RE.search(stem)
+                language_code = match.group(1).lower() if match else None
                 
-            for file in dir_path.iterdir():
-                if file.is_file() and file.suffix.lower() in subtitle_extensions:
-                    # Check if this subtitle belongs to our video
-                    if file.stem.startswith(base_filename):
-                        # Extract language code if present
-                        # Format: ShowName.S01E01.en.srt or ShowName.S01E01.srt
-                        parts = file.stem.split('.')
-                        language_code = None
-                        
-                        # Try to find language code (usually 2-3 letters after episode number)
-                        if len(parts) > 1:
-                            possible_lang = parts[-1]
-                            if len(possible_lang) in [2, 3] and possible_lang.isalpha():
-                                language_code = possible_lang.lower()
-                        
-                        external_subs.append({
-                            'file_path': str(file),
-                            'file_name': file.name,
-                            'language_code': language_code,
-                            'format': file.suffix[1:].upper()
-                        })
+                external_subs.append({
+                    'file_path': os.path.join(directory, name),
+                    'file_name': name,
+                    'language_code': language_code,
+                    'format': ext.upper()
+                })
         except Exception as e:
             print(f"Error scanning for subtitles: {e}")
             
@@ -229,38 +493,160 @@ class PlexService:
     
     def get_episode_naming_pattern(self, episode: Episode) -> str:
         """Generate Plex-compatible filename base for subtitles"""
-        show_title = episode.grandparentTitle
-        season_num = str(episode.parentIndex).zfill(2)
-        episode_num = str(episode.index).zfill(2)
-        
         # Get the actual filename to match its pattern
         if episode.media:
             actual_file = Path(episode.media[0].parts[0].file).stem
             # Use the actual filename pattern (important for matching)
             return actual_file
         else:
-            # Fallback to standard pattern
+            return self._fallback_naming_pattern(episode)
+    
+    def _fallback_naming_pattern(self, episode: Episode) -> str:
+        """Standard ShowName.S01E01 pattern for episodes without a media file"""
+        show_title = episode.grandparentTitle
+        
+        if show_title.isascii():
+            safe_title = show_title.translate(_SAFE_TITLE_TABLE).strip()
+        else:
+            # Unicode letters/digits are kept too, so filter per character
             safe_title = "".join(c for c in show_title if c.isalnum() or c in ' -_').strip()
-            safe_title = safe_title.replace(' ', '.')
-            return f"{safe_title}.S{season_num}E{episode_num}"
+        safe_title = safe_title.replace(' ', '.')
+        return f"{safe_title}.{_season_episode_code(episode.parentIndex, episode.index)}"
     
-    def format_episode_info(self, episode: Episode, token: Optional[str] = None) -> Dict:
+    def format_episode_info(self, episode: Episode, token: Optional[str] = None, refresh: bool = False) -> Dict:
         """Format episode information for API response"""
-        file_info = self.get_episode_file_info(episode)
+        file_info = self.get_episode_file_info(episode, refresh)
+        season, index = episode.parentIndex, episode.index
         
         return {
             'id': episode.ratingKey,
             'title': episode.title,
             'show': episode.grandparentTitle,
-            'season': episode.parentIndex,
-            'episode': episode.index,
-            'season_episode': f"S{str(episode.parentIndex).zfill(2)}E{str(episode.index).zfill(2)}",
+            'season': season,
+            'episode': index,
+            'season_episode': _season_episode_code(season, index),
             'file_info': file_info,
-            'naming_pattern': self.get_episode_naming_pattern(episode),
+            # file_info already holds the media file's stem
+            'naming_pattern': file_info['file_name'] if file_info else self._fallback_naming_pattern(episode),
             'thumb': self.get_full_image_url(episode.thumb, token),
             'duration': episode.duration,
             'viewed': episode.isWatched
         }
+    
+    def _call_with_retry(self, func, *args, **kwargs):
+        """Call func, retrying connection errors, timeouts, 429 and 5xx with jittered backoff
+        
+        Calls nested inside another _call_with_retry on the same thread run
+        once; the outermost call owns the retries so attempts don't multiply.
+        """
+        if getattr(_retry_scope, 'active', False):
+            return func(*args, **kwargs)
+        
+        _retry_scope.active = True
+        try:
+            return self._retry_loop(func, *args, **kwargs)
+        finally:
+            _retry_scope.active = False
+    
+    def _retry_loop(self, func, *args, **kwargs):
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
+            try:
+                return func(*args, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self.RETRY_ATTEMPTS:
+                    raise
+                reason = type(e).__name__
+            except BadRequest as e:
+                status = _retryable_status(e)
+                if status is None or attempt == self.RETRY_ATTEMPTS:
+                    raise
+                reason = f"HTTP {status}"
+            
+            delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            delay = random.uniform(delay / 2, delay)
+            print(f"⚠️  Plex request failed ({reason}), retrying in {delay:.1f}s "
+                  f"(attempt {attempt}/{self.RETRY_ATTEMPTS})")
+            time.sleep(delay)
+    
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking plexapi call on the I/O thread pool, gated and retried"""
+        if self._gate is None:
+            self._gate = asyncio.Semaphore(self._concurrency)
+        loop = asyncio.get_running_loop()
+        async with self._gate:
+            return await loop.run_in_executor(
+                self._executor, partial(self._call_with_retry, func, *args, **kwargs)
+            )
+    
+    async def connect_async(self, token: Optional[str] = None) -> PlexServer:
+        """Async variant of connect"""
+        return await self._run_blocking(self.connect, token)
+    
+    async def get_tv_libraries_async(self, token: Optional[str] = None) -> List[ShowSection]:
+        """Async variant of get_tv_libraries"""
+        return await self._run_blocking(self.get_tv_libraries, token)
+    
+    async def get_library_size_async(self, library: ShowSection) -> int:
+        """Number of items in a library section"""
+        return await self._run_blocking(lambda: len(library.all()))
+    
+    async def get_all_shows_async(self, library_name: Optional[str] = None, token: Optional[str] = None) -> List[Show]:
+        """Async variant of get_all_shows"""
+        return await self._run_blocking(self.get_all_shows, library_name, token)
+    
+    async def get_shows_page_async(self, library_name: Optional[str] = None, token: Optional[str] = None,
+                                   offset: int = 0, limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """Async variant of get_shows_page"""
+        return await self._run_blocking(self.get_shows_page, library_name, token, offset, limit)
+    
+    async def get_show_async(self, show_id: str, token: Optional[str] = None) -> Show:
+        """Async variant of get_show"""
+        return await self._run_blocking(self.get_show, show_id, token)
+    
+    async def get_episode_async(self, episode_id: str, token: Optional[str] = None) -> Episode:
+        """Fetch a single episode by ID without blocking the event loop"""
+        plex = await self.connect_async(token)
+        return await self._run_blocking(plex.fetchItem, int(episode_id))
+    
+    async def get_episodes_async(self, show: Show) -> List[Episode]:
+        """Async variant of get_episodes"""
+        return await self._run_blocking(self.get_episodes, show)
+    
+    async def get_show_episodes_bulk_async(self, show_id: str, token: Optional[str] = None) -> List[Episode]:
+        """Async variant of get_show_episodes_bulk"""
+        return await self._run_blocking(self.get_show_episodes_bulk, show_id, token)
+    
+    async def get_seasons_async(self, show: Show) -> List:
+        """Get all seasons for a show without blocking the event loop"""
+        return await self._run_blocking(show.seasons)
+    
+    async def get_episode_file_info_async(self, episode: Episode, refresh: bool = False) -> Dict:
+        """Async variant of get_episode_file_info"""
+        return await self._run_blocking(self.get_episode_file_info, episode, refresh)
+    
+    async def format_episode_info_async(self, episode: Episode, token: Optional[str] = None, refresh: bool = False) -> Dict:
+        """Async variant of format_episode_info"""
+        return await self._run_blocking(self.format_episode_info, episode, token, refresh)
+    
+    async def prefetch_subtitle_listings_async(self, directories) -> None:
+        """List directories in parallel on the filesystem pool, warming the listing cache"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(self._fs_pool, self._list_subtitle_files, directory)
+              for directory in set(directories))
+        )
+    
+    async def format_episodes_async(self, episodes: List[Episode], token: Optional[str] = None) -> List[Dict]:
+        """Format many episodes concurrently (bounded by the I/O pool size)"""
+        # Scan each distinct directory once up front; otherwise episodes of the
+        # same season would race to list the same folder
+        file_paths = (self._episode_file_path(episode) for episode in episodes)
+        await self.prefetch_subtitle_listings_async(
+            str(Path(file_path).parent) for file_path in file_paths if file_path
+        )
+        return list(await asyncio.gather(
+            *(self.format_episode_info_async(episode, token) for episode in episodes)
+        ))
 
 
 # Singleton instance
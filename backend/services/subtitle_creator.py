@@ -2,20 +2,33 @@
 Refactored dual subtitle creation service
 """
 
+import os
+import re
 import tempfile
 import sys
+import atexit
+import queue
+import threading
+import io
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 import pysubs2
-import ffmpeg
+from pysubs2.formats import autodetect_format
+from pysubs2.subrip import SubripFormat
+from pysubs2.substation import STYLE_FIELDS, MAX_REPRESENTABLE_TIME
 # Add backend directory to path
 backend_dir = Path(__file__).parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 from config import settings
+from compat import DATACLASS_SLOTS
+from subtitle_utils import merge_sorted_events, is_plain_text, write_plain_srt
 from exceptions import (
     SubtitleError,
     SubtitleFormatError,
@@ -23,7 +36,248 @@ from exceptions import (
     FileOperationError
 )
 from services.sync_plugins import SubtitleSynchronizer, SyncMethod
-from services.language_detector import SimpleLanguageDetector, Language
+from services.language_detector import SimpleLanguageDetector, Language, LanguageDetectionResult
+
+
+CJK_LANGUAGES = frozenset({
+    Language.JAPANESE,
+    Language.CHINESE_SIMPLIFIED,
+    Language.CHINESE_TRADITIONAL,
+    Language.KOREAN
+})
+
+_get_end = operator.attrgetter('end')
+
+# Track tags for the SRT merge columns
+_TYPE_PRIMARY = 0
+_TYPE_SECONDARY = 1
+
+_BLANK_LINE_RE = re.compile(r"\s*$")
+_NUMBER_LINE_RE = re.compile(r"\s*\d+\s*$")
+_TRAILING_NUMBER_RE = re.compile(r"\n+ *\d+ *$")
+
+# Prefer RAM-backed storage for short-lived sync output when available
+_FAST_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Shared detector for the memoized helpers below
+_detector = SimpleLanguageDetector()
+
+# Primary and secondary files are independent, so their I/O-bound
+# loading/detection runs side by side; one pool serves every creator
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dualsub_io")
+
+
+def _file_signature(file_path: str) -> Tuple[str, int, int]:
+    """(path, mtime_ns, size) - changes whenever the file is rewritten"""
+    stat = os.stat(file_path)
+    return str(file_path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_detect_language(
+    path: str, mtime_ns: int, size: int, declared_lang: Optional[str]
+) -> LanguageDetectionResult:
+    """Language detection memoized per file version"""
+    return _detector.detect_from_file(Path(path), declared_lang)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_detect_encoding(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Encoding detection memoized per file version"""
+    return _detector.detect_encoding(Path(path))
+
+
+def _max_end(subs: pysubs2.SSAFile) -> int:
+    """Latest end time (ms) across all events"""
+    return max(map(_get_end, subs.events))
+
+
+@functools.lru_cache(maxsize=128)
+def _hex_to_ass_color(hex_color: str) -> str:
+    """Convert hex color (#RRGGBB) to ASS format (&HBBGGRR); colors repeat, so memoized"""
+    if hex_color.startswith('&H'):
+        return hex_color
+    
+    digits = hex_color[1:] if hex_color.startswith('#') else hex_color
+    if len(digits) == 6:
+        try:
+            value = int(digits, 16)
+        except ValueError:
+            return "&HFFFFFF"  # Not hex, default to white
+        # Swap the red and blue bytes
+        return "&H%02X%02X%02X" % (value & 0xFF, (value >> 8) & 0xFF, value >> 16)
+    
+    return "&HFFFFFF"  # Default to white
+
+
+@functools.lru_cache(maxsize=256)
+def _build_ass_style(
+    color: str,
+    font_size: int,
+    margin_v: int,
+    font_name: str,
+    bold: bool,
+    italic: bool,
+    border_style: int,
+    outline_width: int,
+    shadow_depth: int
+) -> pysubs2.SSAStyle:
+    """Build an ASS style; memoized since a batch reuses the same few configs"""
+    return pysubs2.SSAStyle(
+        fontname=font_name,
+        fontsize=font_size,
+        primarycolor=color,
+        secondarycolor=color,
+        outlinecolor="&H00000000",  # Black outline
+        backcolor="&H80000000",     # Semi-transparent shadow
+        bold=-1 if bold else 0,
+        italic=-1 if italic else 0,
+        borderstyle=border_style,
+        outline=outline_width,
+        shadow=shadow_depth,
+        alignment=2,  # Bottom-center
+        marginl=10,
+        marginr=10,
+        marginv=margin_v,
+        encoding=1
+    )
+
+
+def _parse_plain_srt(content: str) -> pysubs2.SSAFile:
+    """
+    Parse SRT text that contains no HTML tags
+    
+    Same result as pysubs2's SRT reader, minus its per-event tag rewriting,
+    which is a no-op without '<' in the content.
+    """
+    timestamp_re = SubripFormat.TIMESTAMP
+    timestamp_to_ms = SubripFormat.timestamp_to_ms
+    
+    # Lines as a text file iterates them (newline kept, no trailing empty line)
+    parts = content.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    
+    timestamps = []  # (start, end)
+    following_lines = []  # Lines following each timestamp line
+    for line in lines:
+        stamps = timestamp_re.findall(line)
+        if len(stamps) == 2:
+            timestamps.append((timestamp_to_ms(stamps[0]), timestamp_to_ms(stamps[1])))
+            following_lines.append([])
+        elif timestamps:
+            following_lines[-1].append(line)
+    
+    def prepare_text(text_lines: List[str]) -> str:
+        # Empty cue: blank line(s) followed by the next cue's number
+        if (len(text_lines) >= 2
+                and all(_BLANK_LINE_RE.match(line) for line in text_lines[:-1])
+                and _NUMBER_LINE_RE.match(text_lines[-1])):
+            return ""
+        text = _TRAILING_NUMBER_RE.sub("", "".join(text_lines).strip())  # Next cue's number
+        return text.replace("\n", "\\N")
+    
+    subs = pysubs2.SSAFile()
+    subs.format = 'srt'
+    SSAEvent = pysubs2.SSAEvent
+    subs.events = [
+        SSAEvent(start=start, end=end, text=prepare_text(text_lines))
+        for (start, end), text_lines in zip(timestamps, following_lines)
+    ]
+    return subs
+
+
+def _ms_to_ass(ms: int) -> str:
+    """Integer ms to 'H:MM:SS.cc', rounded and clamped the way pysubs2 writes it"""
+    if ms < 0:
+        ms = 0
+    elif ms > MAX_REPRESENTABLE_TIME:
+        ms = MAX_REPRESENTABLE_TIME
+    h, rem = divmod(ms, 3600000)
+    m, rem = divmod(rem, 60000)
+    s, rem = divmod(rem, 1000)
+    return f"{h}:{m:02d}:{s:02d}.{(rem + 5) // 10:02d}"
+
+
+def _ass_header_key(subs: pysubs2.SSAFile) -> Tuple:
+    """Everything pysubs2 writes ahead of the [Events] lines"""
+    fields = STYLE_FIELDS['ass']
+    return (
+        tuple(subs.info.items()),
+        tuple(subs.aegisub_project.items()),
+        tuple(
+            (name, tuple(str(getattr(style, f)) for f in fields))
+            for name, style in subs.styles.items()
+        )
+    )
+
+
+def _render_ass_header(subs: pysubs2.SSAFile) -> str:
+    """ASS output of `subs` up to and including the [Events] format line"""
+    header_only = pysubs2.SSAFile()
+    header_only.info = dict(subs.info)
+    header_only.aegisub_project = dict(subs.aegisub_project)
+    header_only.styles = subs.styles
+    buffer = io.StringIO()
+    header_only.to_file(buffer, 'ass')
+    return buffer.getvalue()
+
+
+def _write_ass_events(fp, subs: pysubs2.SSAFile):
+    """Write [Events] lines in pysubs2's ASS layout"""
+    to_timestamp = _ms_to_ass
+    for ev in subs.events:
+        fp.write(
+            f"{ev.type}: {ev.layer},{to_timestamp(ev.start)},{to_timestamp(ev.end)},"
+            f"{ev.style},{ev.name},{ev.marginl},{ev.marginr},{ev.marginv},{ev.effect},{ev.text}\n"
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration_ms(path: str, mtime_ns: int) -> int:
+    """Video duration via ffprobe, memoized per file version"""
+    import ffmpeg  # Only needed when validating against a video
+    
+    probe = ffmpeg.probe(path)
+    return int(float(probe['streams'][0]['duration']) * 1000)
+
+
+def _merge_overlapping(
+    starts: List[int], ends: List[int], types: List[int]
+) -> List[Tuple[int, int, List[int]]]:
+    """
+    Merge start-sorted events whose start falls before the running group end
+    
+    An overlapping event of a different type than the group's first event has
+    its text folded in; one of the same type only extends the end time.
+    
+    Returns:
+        (start, end, member indices) for each merged group
+    """
+    groups = []
+    group_start = group_end = 0
+    group_type = -1
+    members = None
+    
+    # The open group lives in locals and is only emitted once it closes
+    for i, (start, end, event_type) in enumerate(zip(starts, ends, types)):
+        if members is not None and start < group_end:
+            if event_type != group_type:
+                members.append(i)
+            if end > group_end:
+                group_end = end
+        else:
+            if members is not None:
+                groups.append((group_start, group_end, members))
+            members = [i]
+            group_start = start
+            group_end = end
+            group_type = event_type
+    
+    if members is not None:
+        groups.append((group_start, group_end, members))
+    return groups
 
 
 class SubtitlePosition(Enum):
@@ -39,7 +293,7 @@ class SubtitleFormat(Enum):
     SSA = "ssa"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DualSubtitleConfig:
     """Configuration for dual subtitle creation"""
     
@@ -76,9 +330,13 @@ class DualSubtitleConfig:
     # Language hints
     primary_language: Optional[str] = None
     secondary_language: Optional[str] = None
+    
+    # Video duration already known to the caller (e.g. Plex metadata), in ms;
+    # when set, sync validation skips probing the video file
+    known_video_duration_ms: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DualSubtitleResult:
     """Result of dual subtitle creation"""
     success: bool
@@ -97,10 +355,20 @@ class DualSubtitleResult:
 class DualSubtitleCreator:
     """Unified dual subtitle creator with improved architecture"""
     
+    # Temp files are unlinked by a background thread, off the request path
+    _deferred_unlink_queue: "queue.Queue[Path]" = queue.Queue()
+    _unlink_worker_started = False
+    _unlink_worker_lock = threading.Lock()
+    
     def __init__(self):
         self.synchronizer = SubtitleSynchronizer()
         self.language_detector = SimpleLanguageDetector()
         self.temp_files: List[Path] = []
+        # Video durations (ms) by path; callers processing a whole library can
+        # prefill this from one batch probe to skip per-file ffprobe runs
+        self.probe_cache: Dict[str, int] = {}
+        # Rendered ASS headers by style set; a batch reuses the same few configs
+        self._ass_header_cache: Dict[Tuple, str] = {}
     
     def create_dual_subtitle(
         self,
@@ -140,14 +408,15 @@ class DualSubtitleCreator:
             
             # Step 2: Load and potentially synchronize subtitles
             primary_subs, secondary_subs, sync_info = self._load_and_sync_subtitles(
-                primary_path, secondary_path, config, video_path
+                primary_path, secondary_path, config
             )
             
             # Step 3: Validate with video if provided
             warnings = []
-            if video_path:
+            if video_path or config.known_video_duration_ms:
                 warnings = self._validate_video_sync(
-                    primary_subs, secondary_subs, video_path
+                    primary_subs, secondary_subs, video_path,
+                    config.known_video_duration_ms
                 )
             
             # Step 4: Merge subtitles based on format
@@ -192,12 +461,11 @@ class DualSubtitleCreator:
     ) -> Dict:
         """Detect languages of subtitle files"""
         
-        primary_result = self.language_detector.detect_from_file(
-            Path(primary_path), declared_primary
-        )
-        secondary_result = self.language_detector.detect_from_file(
-            Path(secondary_path), declared_secondary
+        primary_future = _io_pool.submit(
+            self._detect_file_language, primary_path, declared_primary
         )
+        secondary_result = self._detect_file_language(secondary_path, declared_secondary)
+        primary_result = primary_future.result()
         
         return {
             'primary': {
@@ -212,6 +480,22 @@ class DualSubtitleCreator:
             }
         }
     
+    def _detect_file_language(self, file_path: str, declared_lang: Optional[str]) -> LanguageDetectionResult:
+        """Detect a file's language, reusing the result while the file is unchanged"""
+        try:
+            signature = _file_signature(file_path)
+        except OSError:
+            return self.language_detector.detect_from_file(Path(file_path), declared_lang)
+        return _cached_detect_language(*signature, declared_lang)
+    
+    def _detect_file_encoding(self, file_path: str) -> Optional[str]:
+        """Detect a file's encoding, reusing the result while the file is unchanged"""
+        try:
+            signature = _file_signature(file_path)
+        except OSError:
+            return None
+        return _cached_detect_encoding(*signature)
+    
     def _enhance_config_for_languages(
         self,
         config: DualSubtitleConfig,
@@ -231,18 +515,11 @@ class DualSubtitleCreator:
             config.font_name = primary_font if primary_font != 'Arial' else secondary_font
         
         # Adjust font sizes for CJK languages
-        cjk_languages = [
-            Language.JAPANESE,
-            Language.CHINESE_SIMPLIFIED,
-            Language.CHINESE_TRADITIONAL,
-            Language.KOREAN
-        ]
-        
-        if primary_lang in cjk_languages:
+        if primary_lang in CJK_LANGUAGES:
             config.primary_font_size = max(22, config.primary_font_size)
             config.primary_margin_v = max(25, config.primary_margin_v)
         
-        if secondary_lang in cjk_languages:
+        if secondary_lang in CJK_LANGUAGES:
             config.secondary_font_size = max(20, config.secondary_font_size)
             config.secondary_margin_v = max(25, config.secondary_margin_v)
         
@@ -263,16 +540,17 @@ class DualSubtitleCreator:
     ) -> Tuple[pysubs2.SSAFile, pysubs2.SSAFile, Dict]:
         """Load subtitle files and optionally synchronize them"""
         
-        # Load primary subtitle
-        primary_subs = self._load_subtitle(primary_path)
+        # Load primary subtitle in the background while the secondary is synced/loaded
+        primary_future = _io_pool.submit(self._load_subtitle, primary_path)
         
         sync_info = {'performed': False}
         
         # Synchronize secondary if enabled
         if config.enable_sync and settings.subtitle.enable_sync_by_default:
             try:
-                # Create temp file for synchronized subtitle
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp:
+                # Create temp file for synchronized subtitle (only written by
+                # plugins that can't return their result in memory)
+                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False, dir=_FAST_TEMP_DIR) as tmp:
                     temp_sync_path = tmp.name
                     self.temp_files.append(Path(temp_sync_path))
                 
@@ -282,11 +560,16 @@ class DualSubtitleCreator:
                     target_path=secondary_path,
                     output_path=temp_sync_path,
                     method=config.sync_method,
-                    fallback=True
+                    fallback=True,
+                    in_memory=True
                 )
                 
                 if sync_result.success:
-                    secondary_subs = self._load_subtitle(temp_sync_path)
+                    if sync_result.subtitles is not None:
+                        # In-memory result, no write/reload round trip
+                        secondary_subs = sync_result.subtitles
+                    else:
+                        secondary_subs = self._load_subtitle(temp_sync_path)
                     sync_info = {
                         'performed': True,
                         'method': sync_result.method.value,
@@ -305,6 +588,8 @@ class DualSubtitleCreator:
             # Sync disabled, load original
             secondary_subs = self._load_subtitle(secondary_path)
         
+        primary_subs = primary_future.result()
+        
         return primary_subs, secondary_subs, sync_info
     
     def _load_subtitle(self, file_path: str) -> pysubs2.SSAFile:
@@ -312,10 +597,16 @@ class DualSubtitleCreator:
         
         try:
             # Detect encoding
-            encoding = self.language_detector.detect_encoding(Path(file_path))
+            encoding = self._detect_file_encoding(file_path) or 'utf-8'
             
             # Load subtitle
-            subs = pysubs2.load(file_path, encoding=encoding)
+            with open(file_path, encoding=encoding) as fp:
+                content = fp.read()
+            format_ = autodetect_format(content[:10000])
+            if format_ == 'srt' and '<' not in content:
+                subs = _parse_plain_srt(content)
+            else:
+                subs = pysubs2.SSAFile.from_string(content, format_=format_)
             
             if not subs:
                 raise SubtitleFormatError(file_path, "Empty subtitle file")
@@ -329,39 +620,34 @@ class DualSubtitleCreator:
         self,
         primary_subs: pysubs2.SSAFile,
         secondary_subs: pysubs2.SSAFile,
-        video_path: str
+        video_path: Optional[str],
+        known_duration_ms: Optional[int] = None
     ) -> List[str]:
         """Validate subtitle timing against video duration"""
         
         warnings = []
         
         try:
-            # Get video duration
-            probe = ffmpeg.probe(video_path)
-            video_duration_ms = int(float(probe['streams'][0]['duration']) * 1000)
+            # Get video duration, probing only when the caller doesn't know it
+            if known_duration_ms:
+                video_duration_ms = known_duration_ms
+            else:
+                video_duration_ms = self._get_video_duration_ms(video_path)
             
-            # Check primary subtitle
-            if primary_subs:
-                primary_end = max(line.end for line in primary_subs)
-                if primary_end > video_duration_ms + settings.subtitle.video_sync_tolerance_ms:
-                    warnings.append(
-                        f"Primary subtitle extends {(primary_end - video_duration_ms) / 1000:.1f}s beyond video"
-                    )
-                elif primary_end < video_duration_ms - settings.subtitle.video_sync_warning_threshold_ms:
-                    warnings.append(
-                        f"Primary subtitle ends {(video_duration_ms - primary_end) / 1000:.1f}s before video"
-                    )
+            tolerance_ms = settings.subtitle.video_sync_tolerance_ms
+            warning_threshold_ms = settings.subtitle.video_sync_warning_threshold_ms
             
-            # Check secondary subtitle
-            if secondary_subs:
-                secondary_end = max(line.end for line in secondary_subs)
-                if secondary_end > video_duration_ms + settings.subtitle.video_sync_tolerance_ms:
+            for label, subs in (("Primary", primary_subs), ("Secondary", secondary_subs)):
+                if not subs:
+                    continue
+                subs_end = _max_end(subs)
+                if subs_end > video_duration_ms + tolerance_ms:
                     warnings.append(
-                        f"Secondary subtitle extends {(secondary_end - video_duration_ms) / 1000:.1f}s beyond video"
+                        f"{label} subtitle extends {(subs_end - video_duration_ms) / 1000:.1f}s beyond video"
                     )
-                elif secondary_end < video_duration_ms - settings.subtitle.video_sync_warning_threshold_ms:
+                elif subs_end < video_duration_ms - warning_threshold_ms:
                     warnings.append(
-                        f"Secondary subtitle ends {(video_duration_ms - secondary_end) / 1000:.1f}s before video"
+                        f"{label} subtitle ends {(video_duration_ms - subs_end) / 1000:.1f}s before video"
                     )
                     
         except Exception as e:
@@ -369,6 +655,13 @@ class DualSubtitleCreator:
         
         return warnings
     
+    def _get_video_duration_ms(self, video_path: str) -> int:
+        """Get video duration, preferring prefilled or previously probed values"""
+        duration = self.probe_cache.get(str(video_path))
+        if duration is None:
+            duration = _probe_duration_ms(str(video_path), os.stat(video_path).st_mtime_ns)
+        return duration
+    
     def _create_ass_dual(
         self,
         primary_subs: pysubs2.SSAFile,
@@ -383,26 +676,17 @@ class DualSubtitleCreator:
         dual_subs.styles["Primary"] = self._create_ass_style("Primary", config, True)
         dual_subs.styles["Secondary"] = self._create_ass_style("Secondary", config, False)
         
-        # Add primary subtitles
-        for line in primary_subs:
-            dual_subs.append(pysubs2.SSAEvent(
-                start=line.start,
-                end=line.end,
-                text=line.text,
-                style="Primary"
-            ))
-        
-        # Add secondary subtitles
-        for line in secondary_subs:
-            dual_subs.append(pysubs2.SSAEvent(
-                start=line.start,
-                end=line.end,
-                text=line.text,
-                style="Secondary"
-            ))
-        
-        # Sort by timestamp
-        dual_subs.sort()
+        # Build each track, then merge the two time-ordered tracks linearly
+        SSAEvent = pysubs2.SSAEvent
+        primary_events = [
+            SSAEvent(start=line.start, end=line.end, text=line.text, style="Primary")
+            for line in primary_subs
+        ]
+        secondary_events = [
+            SSAEvent(start=line.start, end=line.end, text=line.text, style="Secondary")
+            for line in secondary_subs
+        ]
+        dual_subs.events = merge_sorted_events(primary_events, secondary_events)
         
         return dual_subs
     
@@ -416,57 +700,46 @@ class DualSubtitleCreator:
         
         dual_subs = pysubs2.SSAFile()
         
-        # Create a timeline of all subtitle events
+        # Prep: build parallel start/end/type/text columns, primary before secondary
+        primary_prefix = config.srt_primary_prefix
+        secondary_prefix = config.srt_secondary_prefix
+        starts = [line.start for line in primary_subs]
+        starts.extend(line.start for line in secondary_subs)
+        ends = [line.end for line in primary_subs]
+        ends.extend(line.end for line in secondary_subs)
+        types = [_TYPE_PRIMARY] * len(primary_subs) + [_TYPE_SECONDARY] * len(secondary_subs)
+        # Pick the loop body once instead of concatenating empty prefixes per cue
+        if primary_prefix:
+            texts = [primary_prefix + line.text for line in primary_subs]
+        else:
+            texts = [line.text for line in primary_subs]
+        if secondary_prefix:
+            texts.extend(secondary_prefix + line.text for line in secondary_subs)
+        else:
+            texts.extend(line.text for line in secondary_subs)
+        
+        # Sort by start time via an index permutation (stable, so primary wins ties)
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        starts = [starts[i] for i in order]
+        ends = [ends[i] for i in order]
+        types = [types[i] for i in order]
+        texts = [texts[i] for i in order]
+        
+        # Stitch: each group's texts are joined once, so dense overlaps stay
+        # linear; lone cues (the common case) skip the join
+        primary_on_top = config.primary_position == SubtitlePosition.TOP
+        SSAEvent = pysubs2.SSAEvent
         events = []
-        
-        # Add primary events
-        for line in primary_subs:
-            text = config.srt_primary_prefix + line.text if config.srt_primary_prefix else line.text
-            events.append({
-                'start': line.start,
-                'end': line.end,
-                'text': text,
-                'type': 'primary'
-            })
-        
-        # Add secondary events
-        for line in secondary_subs:
-            text = config.srt_secondary_prefix + line.text if config.srt_secondary_prefix else line.text
-            events.append({
-                'start': line.start,
-                'end': line.end,
-                'text': text,
-                'type': 'secondary'
-            })
-        
-        # Sort events by start time
-        events.sort(key=lambda x: x['start'])
-        
-        # Merge overlapping events
-        merged_events = []
-        for event in events:
-            # Check if this event overlaps with the last merged event
-            if merged_events and event['start'] < merged_events[-1]['end']:
-                last_event = merged_events[-1]
-                # Combine the texts
-                if event['type'] != last_event.get('type'):
-                    # Different types, combine with line break
-                    if config.primary_position == SubtitlePosition.TOP:
-                        last_event['text'] = f"{event['text']}\\N{last_event['text']}"
-                    else:
-                        last_event['text'] = f"{last_event['text']}\\N{event['text']}"
-                # Extend the end time if necessary
-                last_event['end'] = max(last_event['end'], event['end'])
+        for start, end, members in _merge_overlapping(starts, ends, types):
+            if len(members) == 1:
+                text = texts[members[0]]
+            elif primary_on_top:
+                # Later events go above earlier ones
+                text = "\\N".join([texts[i] for i in reversed(members)])
             else:
-                merged_events.append(event.copy())
-        
-        # Create subtitle events
-        for event in merged_events:
-            dual_subs.append(pysubs2.SSAEvent(
-                start=event['start'],
-                end=event['end'],
-                text=event['text']
-            ))
+                text = "\\N".join([texts[i] for i in members])
+            events.append(SSAEvent(start=start, end=end, text=text))
+        dual_subs.events = events
         
         return dual_subs
     
@@ -487,41 +760,15 @@ class DualSubtitleCreator:
             font_size = config.secondary_font_size
             margin_v = config.secondary_margin_v
         
-        return pysubs2.SSAStyle(
-            fontname=config.font_name,
-            fontsize=font_size,
-            primarycolor=color,
-            secondarycolor=color,
-            outlinecolor="&H00000000",  # Black outline
-            backcolor="&H80000000",     # Semi-transparent shadow
-            bold=-1 if config.bold else 0,
-            italic=-1 if config.italic else 0,
-            borderstyle=config.border_style,
-            outline=config.outline_width,
-            shadow=config.shadow_depth,
-            alignment=2,  # Bottom-center
-            marginl=10,
-            marginr=10,
-            marginv=margin_v,
-            encoding=1
-        )
+        # Styles are mutable, so hand out a copy of the cached one
+        return _build_ass_style(
+            color, font_size, margin_v, config.font_name, config.bold, config.italic,
+            config.border_style, config.outline_width, config.shadow_depth
+        ).copy()
     
     def _convert_color_to_ass(self, hex_color: str) -> str:
         """Convert hex color (#RRGGBB) to ASS format (&HBBGGRR)"""
-        
-        if hex_color.startswith('&H'):
-            return hex_color
-        
-        if hex_color.startswith('#'):
-            hex_color = hex_color[1:]
-        
-        if len(hex_color) == 6:
-            r = hex_color[0:2]
-            g = hex_color[2:4]
-            b = hex_color[4:6]
-            return f"&H{b}{g}{r}"
-        
-        return "&HFFFFFF"  # Default to white
+        return _hex_to_ass_color(hex_color)
     
     def _save_subtitle(
         self,
@@ -531,24 +778,68 @@ class DualSubtitleCreator:
     ):
         """Save subtitle file in specified format"""
         
+        # Write next to the target and rename, so readers never see a partial file
+        tmp_path = f"{output_path}.tmp"
         try:
-            if format == SubtitleFormat.ASS:
-                subs.save(output_path, format_='ass')
+            if format == SubtitleFormat.ASS and not (subs.fonts_opaque or subs.graphics_opaque):
+                self._write_ass(subs, tmp_path)
+            elif format == SubtitleFormat.ASS:
+                subs.save(tmp_path, format_='ass')
             elif format == SubtitleFormat.SSA:
-                subs.save(output_path, format_='ssa')
+                subs.save(tmp_path, format_='ssa')
+            elif is_plain_text(subs):  # SRT without markup
+                write_plain_srt(subs, tmp_path)
             else:  # SRT
-                subs.save(output_path, format_='srt')
+                subs.save(tmp_path, format_='srt')
+            os.replace(tmp_path, output_path)
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             raise FileOperationError("save", output_path, str(e))
     
+    def _write_ass(self, subs: pysubs2.SSAFile, output_path: str):
+        """Write ASS output from a cached header plus streamed events"""
+        key = _ass_header_key(subs)
+        header = self._ass_header_cache.get(key)
+        if header is None:
+            header = self._ass_header_cache[key] = _render_ass_header(subs)
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as fp:
+            fp.write(header)
+            _write_ass_events(fp, subs)
+    
     def _cleanup_temp_files(self):
-        """Clean up temporary files created during processing"""
+        """Hand temporary files created during processing to the unlink worker"""
         
-        for temp_file in self.temp_files:
+        if not self.temp_files:
+            return
+        self._ensure_unlink_worker()
+        while self.temp_files:
+            self._deferred_unlink_queue.put(self.temp_files.pop())
+    
+    @classmethod
+    def _ensure_unlink_worker(cls):
+        """Start the unlink worker once, and drain its queue at interpreter exit"""
+        if cls._unlink_worker_started:
+            return
+        with cls._unlink_worker_lock:
+            if cls._unlink_worker_started:
+                return
+            threading.Thread(
+                target=cls._unlink_worker, name="dualsub_cleanup", daemon=True
+            ).start()
+            atexit.register(cls._deferred_unlink_queue.join)
+            cls._unlink_worker_started = True
+    
+    @classmethod
+    def _unlink_worker(cls):
+        """Unlink queued temp files until the process exits"""
+        while True:
+            temp_file = cls._deferred_unlink_queue.get()
             try:
-                if temp_file.exists():
-                    temp_file.unlink()
-            except:
+                temp_file.unlink(missing_ok=True)
+            except OSError:
                 pass  # Ignore cleanup errors
-        
-        self.temp_files.clear()
\ No newline at end of file
+            finally:
+                cls._deferred_unlink_queue.task_done()
\ No newline at end of file
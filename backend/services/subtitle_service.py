@@ -3,17 +3,333 @@ Subtitle Service - handles subtitle file operations and dual subtitle creation
 """
 
 import pysubs2
-import chardet
-import ffmpeg
+from pysubs2.subrip import SubripFormat
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace, astuple
 from enum import Enum
 import unicodedata
 import subprocess
 import tempfile
 import shutil
+import os
+import sys
+import functools
+import operator
+import bisect
+import hashlib
+import logging
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import islice, repeat
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from subtitle_utils import merge_sorted_events, save_srt
+
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized script counting for long texts
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_get_start = operator.attrgetter('start')
+_get_end = operator.attrgetter('end')
+
+# Primary and secondary files are independent, so their loading/analysis
+# runs side by side
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="subtitle_io")
+
+# Batch workers are spawned, not forked: a forked child inherits _io_pool
+# believing it has idle threads that don't exist there, and blocks forever
+_batch_mp_context = multiprocessing.get_context("spawn")
+
+# Subtitle markup: HTML tags and ASS override blocks
+_SUBTITLE_TAG_RE = re.compile(r'<[^>]+>|\{[^}]+\}')
+# Anything that isn't a word character, whitespace or CJK punctuation/ideograph
+_NON_TEXT_RE = re.compile(r'[^\w\s\u3000-\u9FFF]')
+
+# Language-specific font preferences (best first) for better CJK support
+_LANGUAGE_FONTS = {
+    'ja': ['NotoSansCJK-Regular', 'Hiragino Sans', 'MS Gothic', 'Arial Unicode MS', 'Arial'],
+    'zh-CN': ['NotoSansCJK-Regular', 'Microsoft YaHei', 'SimSun', 'Arial Unicode MS', 'Arial'],
+    'zh-TW': ['NotoSansCJK-Regular', 'Microsoft JhengHei', 'PMingLiU', 'Arial Unicode MS', 'Arial'],
+    'en': ['Arial', 'Helvetica', 'sans-serif'],
+    'default': ['Arial', 'sans-serif']
+}
+_OPTIMAL_FONTS = {lang: fonts[0] for lang, fonts in _LANGUAGE_FONTS.items()}
+
+# SRT line prefixes by language code
+_LANG_PREFIXES = {
+    'en': '[EN] ',
+    'ja': '[JA] ',
+    'zh-CN': '[CN] ',
+    'zh-TW': '[TW] ',
+    'ko': '[KO] ',
+    'fr': '[FR] ',
+    'es': '[ES] ',
+    'de': '[DE] ',
+}
+
+# Common variations of language names/codes
+_LANG_NORMALIZE = {
+    'chinese': 'zh-CN',
+    'mandarin': 'zh-CN',
+    'simplified': 'zh-CN',
+    'traditional': 'zh-TW',
+    'cantonese': 'zh-TW',
+    'japanese': 'ja',
+    'english': 'en',
+    'zh': 'zh-CN',  # Default Chinese to Simplified
+    'cn': 'zh-CN',
+    'tw': 'zh-TW',
+    'hk': 'zh-TW',
+    'jp': 'ja',
+}
+
+# Below this length str.translate beats numpy's per-call overhead
+_NUMPY_MIN_CHARS = 256
+
+# Below this many secondary events the interval index beats numpy's setup cost
+_NUMPY_MIN_EVENTS = 256
+
+
+# Character class flags used by LanguageDetector's script tables
+_SCRIPT_HIRAGANA = 1
+_SCRIPT_KATAKANA = 2
+_SCRIPT_CJK = 4
+_SCRIPT_TRADITIONAL = 8
+_SCRIPT_SIMPLIFIED = 16
+_SCRIPT_ASCII = 32
+
+
+def _build_script_tables(ranges, traditional, simplified) -> Tuple[bytes, bytes]:
+    """
+    Two-level BMP classifier: flags for code point cp are
+    blocks[(index[cp >> 8] << 8) | (cp & 0xFF)]
+    
+    Identical 256-code-point blocks are stored once, so the table only holds
+    the empty block, the kana block, one plain CJK block and the handful of
+    CJK blocks containing indicator characters.
+    """
+    flat = bytearray(0x10000)
+    for flag, (lo, hi) in ranges:
+        for cp in range(lo, hi + 1):
+            flat[cp] |= flag
+    for char in traditional:
+        flat[ord(char)] |= _SCRIPT_TRADITIONAL
+    for char in simplified:
+        flat[ord(char)] |= _SCRIPT_SIMPLIFIED
+    
+    index = bytearray(256)
+    block_ids = {}
+    blocks = bytearray()
+    for high in range(256):
+        block = bytes(flat[high << 8:(high + 1) << 8])
+        if block not in block_ids:
+            block_ids[block] = len(block_ids)
+            blocks += block
+        index[high] = block_ids[block]
+    return bytes(index), bytes(blocks)
+
+
+def _unpack_script_histogram(histogram) -> Tuple[int, int, int, int, int, int]:
+    """Fold per-flag-combination counts into (hiragana, katakana, cjk, ascii, traditional, simplified)"""
+    totals = [0] * 6
+    for flags, count in enumerate(histogram):
+        if count:
+            for bit in range(6):
+                if flags >> bit & 1:
+                    totals[bit] += count
+    hiragana, katakana, cjk, traditional, simplified, ascii_count = totals
+    return hiragana, katakana, cjk, ascii_count, traditional, simplified
+
+
+def _decide_language(
+    hiragana_pct: float,
+    katakana_pct: float,
+    cjk_pct: float,
+    ascii_pct: float,
+    cjk_count: int,
+    traditional_score: int,
+    simplified_score: int,
+    japanese_particle_count: int
+) -> Tuple[str, float]:
+    """
+    LanguageDetector's decision tree over precomputed script statistics
+    Returns: (detected language, confidence)
+    """
+    # If mostly ASCII, likely English
+    if ascii_pct > 0.8:
+        return 'en', min(0.9, ascii_pct)
+    
+    # The Chinese variant with more indicators (Simplified on ties) and its score
+    chinese_score = max(traditional_score, simplified_score)
+    chinese_lang = 'zh-TW' if traditional_score > simplified_score else 'zh-CN'
+    few_chinese_indicators = chinese_score < 3
+    
+    # If has significant CJK content, analyze Chinese vs Japanese
+    if cjk_pct > 0.3:
+        # Check for Chinese indicators first (more reliable)
+        if chinese_score > 5:
+            return chinese_lang, 0.8 + min(0.2, chinese_score / max(1, cjk_count) * 20)
+        
+        # Only classify as Japanese if we have strong Japanese indicators AND low Chinese indicators
+        if (hiragana_pct > 0.05 or japanese_particle_count > 2) and few_chinese_indicators:
+            return 'ja', 0.9 + min(0.1, hiragana_pct * 2)
+        
+        # Fallback Chinese detection for CJK heavy content
+        if chinese_score > 0:
+            return chinese_lang, 0.7 + min(0.3, chinese_score / max(1, cjk_count) * 10)
+        
+        # Has CJK but no clear indicators - default to Chinese (more common)
+        return 'zh-CN', 0.6
+    
+    # Light hiragana with some Japanese particles - likely Japanese
+    if hiragana_pct > 0.05 or japanese_particle_count > 0:
+        return 'ja', 0.9 + min(0.1, hiragana_pct * 2)
+    
+    # Mixed scripts might be Japanese with kanji (but only if low Chinese indicators)
+    if cjk_pct > 0.1 and (hiragana_pct > 0.01 or katakana_pct > 0.01) and few_chinese_indicators:
+        return 'ja', 0.8
+    
+    # Fallback for edge cases
+    return 'en', 0.4
+
+def _restyled_events(subs: pysubs2.SSAFile, style: str, owned: bool = False) -> List[pysubs2.SSAEvent]:
+    """
+    Events of `subs` as plain lines in the given style
+    
+    Only start, end and text carry over. The SRT reader sets nothing else, so
+    an SRT file the caller owns (e.g. fresh ffsubsync output) has its events
+    restyled in place instead of rebuilt; shared cached files are never touched.
+    """
+    if owned and subs.format == 'srt':
+        for line in subs.events:
+            line.style = style
+        return subs.events
+    
+    SSAEvent = pysubs2.SSAEvent
+    return [SSAEvent(start=line.start, end=line.end, text=line.text, style=style) for line in subs]
+
+
+def _prefixed_texts(events: List[pysubs2.SSAEvent], prefix: str) -> List[str]:
+    """
+    Texts of `events`, each with `prefix` prepended
+    
+    Joins the texts on NUL and inserts the prefix with one replace over the
+    whole buffer, instead of a concatenation per line.
+    """
+    texts = [line.text for line in events]
+    if not prefix or not texts:
+        return texts
+    joined = '\0'.join(texts)
+    if joined.count('\0') != len(texts) - 1:  # NUL inside a line's text
+        return [prefix + text for text in texts]
+    return (prefix + joined.replace('\0', '\0' + prefix)).split('\0')
+
+
+def _first_primary_hits(
+    primary_events: List[pysubs2.SSAEvent], secondary_events: List[pysubs2.SSAEvent]
+) -> Optional[List[int]]:
+    """
+    For each secondary event, the index of the first primary event whose
+    [start, end] contains its start or end, or -1 if none does
+    
+    Vectorized with numpy for the usual case of primaries in time order with
+    non-decreasing ends, where the primaries containing a given time form one
+    run beginning at the first end >= that time. Returns None when numpy is
+    unavailable, the input is small, or the primaries aren't ordered that way.
+    """
+    count = len(primary_events)
+    if np is None or not count or len(secondary_events) < _NUMPY_MIN_EVENTS:
+        return None
+    
+    p_start = np.fromiter(map(_get_start, primary_events), dtype=np.int64, count=count)
+    p_end = np.fromiter(map(_get_end, primary_events), dtype=np.int64, count=count)
+    if (p_start[1:] < p_start[:-1]).any() or (p_end[1:] < p_end[:-1]).any():
+        return None
+    
+    last = count - 1
+    hits = None
+    for getter in (_get_start, _get_end):
+        times = np.fromiter(map(getter, secondary_events), dtype=np.int64, count=len(secondary_events))
+        index = np.minimum(np.searchsorted(p_end, times, side='left'), last)
+        contained = (p_end[index] >= times) & (p_start[index] <= times)
+        found = np.where(contained, index, count)
+        hits = found if hits is None else np.minimum(hits, found)
+    hits[hits == count] = -1
+    return hits.tolist()
+
+
+class _EventIntervalIndex:
+    """
+    Start-sorted index of event intervals answering "which event, in
+    insertion order, is the first whose [start, end] contains this time?"
+    
+    A containing event starts no earlier than time - longest duration, so a
+    query only inspects the events starting in that window: O(log n + k)
+    instead of a scan over every event. Events longer than LONG_EVENT_MS
+    (signs, credits) are kept in a separate short list and always checked,
+    so one of them can't widen the window for every query.
+    """
+    
+    LONG_EVENT_MS = 30000
+    
+    def __init__(self):
+        self._starts: List[int] = []  # Sorted
+        self._entries: List[Tuple[int, int]] = []  # (end, insertion index), parallel to _starts
+        self._max_duration = 0
+        self._long: List[Tuple[int, int, int]] = []  # (start, end, insertion index)
+    
+    def add(self, start: int, end: int, index: int):
+        duration = end - start
+        if duration > self.LONG_EVENT_MS:
+            self._long.append((start, end, index))
+            return
+        pos = bisect.bisect_right(self._starts, start)
+        self._starts.insert(pos, start)
+        self._entries.insert(pos, (end, index))
+        if duration > self._max_duration:
+            self._max_duration = duration
+    
+    def add_all(self, events):
+        """Replace the index contents with events, numbered by list position"""
+        limit = self.LONG_EVENT_MS
+        spans = []
+        self._long = []
+        for index, line in enumerate(events):
+            if line.end - line.start > limit:
+                self._long.append((line.start, line.end, index))
+            else:
+                spans.append((line.start, line.end, index))
+        spans.sort()
+        self._starts = [start for start, _, _ in spans]
+        self._entries = [(end, index) for _, end, index in spans]
+        self._max_duration = max(0, max((end - start for start, end, _ in spans), default=0))
+    
+    def first_containing(self, *times: int) -> Optional[int]:
+        """Lowest insertion index among events containing any of the given times"""
+        starts = self._starts
+        entries = self._entries
+        best = None
+        for time in times:
+            lo = bisect.bisect_left(starts, time - self._max_duration)
+            hi = bisect.bisect_right(starts, time)
+            for end, index in entries[lo:hi]:
+                if end >= time and (best is None or index < best):
+                    best = index
+            for start, end, index in self._long:
+                if start <= time <= end and (best is None or index < best):
+                    best = index
+        return best
+
 
 class SubtitlePosition(Enum):
     TOP = "top"
@@ -62,24 +378,33 @@ class LanguageDetector:
     CJK_EXT_A_RANGE = (0x3400, 0x4DBF)   # CJK Extension A
     
     # Common characters that help distinguish Traditional vs Simplified
-    TRADITIONAL_INDICATORS = {
+    TRADITIONAL_INDICATORS = frozenset({
         '這', '個', '來', '對', '時', '會', '學', '說', '國', '們', '現', '開',
         '關', '進', '過', '還', '應', '經', '長', '實', '發', '點', '間', '問',
         '題', '機', '車', '電', '話', '見', '聽', '買', '賣', '錢', '業', '東',
-        '風', '雲', '龍', '鳳', '馬', '魚', '鳥', '書', '學', '醫', '藥'
-    }
+        '風', '雲', '龍', '鳳', '馬', '魚', '鳥', '書', '醫', '藥'
+    })
     
-    SIMPLIFIED_INDICATORS = {
+    SIMPLIFIED_INDICATORS = frozenset({
         '这', '个', '来', '对', '时', '会', '学', '说', '国', '们', '现', '开',
         '关', '进', '过', '还', '应', '经', '长', '实', '发', '点', '间', '问',
         '题', '机', '车', '电', '话', '见', '听', '买', '卖', '钱', '业', '东',
-        '风', '云', '龙', '凤', '马', '鱼', '鸟', '书', '学', '医', '药'
-    }
+        '风', '云', '龙', '凤', '马', '鱼', '鸟', '书', '医', '药'
+    })
+    
+    # (index, blocks) classifier tables and the flat str.translate table
+    # derived from them, built on first use
+    _script_tables: Optional[Tuple[bytes, bytes]] = None
+    _script_translate_table: Optional[str] = None
     
     # Common Japanese-specific characters (beyond hiragana/katakana)
     JAPANESE_PARTICLES = {'は', 'が', 'を', 'に', 'へ', 'で', 'と', 'も', 'の', 'か'}
     JAPANESE_COMMON = {'です', 'ます', 'った', 'いる', 'ある', 'する', 'なる', 'いう', 'れる', 'られる'}
     
+    # analyze_subtitle_file stops sampling at whichever limit comes first
+    SAMPLE_MAX_LINES = 50
+    SAMPLE_TARGET_CHARS = 2000
+    
     @staticmethod
     def detect_language(text: str, declared_lang: Optional[str] = None) -> Dict:
         """
@@ -102,8 +427,8 @@ class LanguageDetector:
             }
         
         # Clean text for analysis
-        clean_text = re.sub(r'[^\w\s\u3000-\u9FFF]', '', text)
-        total_chars = len(clean_text.replace(' ', ''))
+        clean_text = _NON_TEXT_RE.sub('', text)
+        total_chars = len(clean_text) - clean_text.count(' ')
         
         if total_chars == 0:
             return {
@@ -114,19 +439,21 @@ class LanguageDetector:
                 'recommendation': declared_lang or 'en'
             }
         
-        # Count different character types
-        hiragana_count = sum(1 for char in clean_text if LanguageDetector.HIRAGANA_RANGE[0] <= ord(char) <= LanguageDetector.HIRAGANA_RANGE[1])
-        katakana_count = sum(1 for char in clean_text if LanguageDetector.KATAKANA_RANGE[0] <= ord(char) <= LanguageDetector.KATAKANA_RANGE[1])
-        cjk_count = sum(1 for char in clean_text if LanguageDetector.CJK_UNIFIED_RANGE[0] <= ord(char) <= LanguageDetector.CJK_UNIFIED_RANGE[1])
-        ascii_count = sum(1 for char in clean_text if ord(char) < 128)
-        
-        # Count Traditional vs Simplified indicators
-        traditional_score = sum(1 for char in clean_text if char in LanguageDetector.TRADITIONAL_INDICATORS)
-        simplified_score = sum(1 for char in clean_text if char in LanguageDetector.SIMPLIFIED_INDICATORS)
-        
-        # Japanese-specific markers
-        japanese_particle_count = sum(1 for word in LanguageDetector.JAPANESE_PARTICLES if word in text)
-        japanese_common_count = sum(1 for word in LanguageDetector.JAPANESE_COMMON if word in text)
+        if clean_text.isascii():
+            # Common case (English): every character is ASCII and there can be
+            # no kana markers, so the counts are known without scanning
+            hiragana_count = katakana_count = cjk_count = 0
+            traditional_score = simplified_score = 0
+            ascii_count = len(clean_text)
+            japanese_particle_count = japanese_common_count = 0
+        else:
+            # Count different character types, plus Traditional vs Simplified indicators
+            (hiragana_count, katakana_count, cjk_count, ascii_count,
+             traditional_score, simplified_score) = LanguageDetector._count_scripts(clean_text)
+            
+            # Japanese-specific markers
+            japanese_particle_count = sum(1 for word in LanguageDetector.JAPANESE_PARTICLES if word in text)
+            japanese_common_count = sum(1 for word in LanguageDetector.JAPANESE_COMMON if word in text)
         
         # Calculate percentages
         hiragana_pct = hiragana_count / total_chars if total_chars > 0 else 0
@@ -150,57 +477,10 @@ class LanguageDetector:
         }
         
         # Detection logic
-        confidence = 0.0
-        detected = 'unknown'
-        
-        # If mostly ASCII, likely English
-        if ascii_pct > 0.8:
-            detected = 'en'
-            confidence = min(0.9, ascii_pct)
-        
-        # If has significant CJK content, analyze Chinese vs Japanese
-        elif cjk_pct > 0.3:
-            # Check for Chinese indicators first (more reliable)
-            if traditional_score > 5 or simplified_score > 5:
-                # Strong Chinese indicators found
-                if traditional_score > simplified_score:
-                    detected = 'zh-TW'
-                    confidence = 0.8 + min(0.2, traditional_score / max(1, cjk_count) * 20)
-                else:
-                    detected = 'zh-CN' 
-                    confidence = 0.8 + min(0.2, simplified_score / max(1, cjk_count) * 20)
-            
-            # Only classify as Japanese if we have strong Japanese indicators AND low Chinese indicators
-            elif (hiragana_pct > 0.05 or japanese_particle_count > 2) and traditional_score < 3 and simplified_score < 3:
-                detected = 'ja'
-                confidence = 0.9 + min(0.1, hiragana_pct * 2)
-            
-            # Fallback Chinese detection for CJK heavy content
-            elif traditional_score > simplified_score and traditional_score > 0:
-                detected = 'zh-TW'
-                confidence = 0.7 + min(0.3, traditional_score / max(1, cjk_count) * 10)
-            elif simplified_score > 0:
-                detected = 'zh-CN'
-                confidence = 0.7 + min(0.3, simplified_score / max(1, cjk_count) * 10)
-            else:
-                # Has CJK but no clear indicators - default to Chinese (more common)
-                detected = 'zh-CN'
-                confidence = 0.6
-        
-        # Light hiragana with some Japanese particles - likely Japanese
-        elif hiragana_pct > 0.05 or japanese_particle_count > 0:
-            detected = 'ja'
-            confidence = 0.9 + min(0.1, hiragana_pct * 2)
-        
-        # Mixed scripts might be Japanese with kanji (but only if low Chinese indicators)
-        elif cjk_pct > 0.1 and (hiragana_pct > 0.01 or katakana_pct > 0.01) and traditional_score < 3 and simplified_score < 3:
-            detected = 'ja'
-            confidence = 0.8
-        
-        # Fallback for edge cases
-        else:
-            detected = 'en'
-            confidence = 0.4
+        detected, confidence = _decide_language(
+            hiragana_pct, katakana_pct, cjk_pct, ascii_pct, cjk_count,
+            traditional_score, simplified_score, japanese_particle_count
+        )
         
         # Adjust confidence based on declared language agreement
         recommendation = detected
@@ -222,6 +502,63 @@ class LanguageDetector:
             'recommendation': recommendation
         }
     
+    @staticmethod
+    def _get_script_tables() -> Tuple[bytes, bytes]:
+        """Classifier tables for _count_scripts, built once per process"""
+        tables = LanguageDetector._script_tables
+        if tables is None:
+            tables = LanguageDetector._script_tables = _build_script_tables(
+                (
+                    (_SCRIPT_ASCII, (0, 127)),
+                    (_SCRIPT_HIRAGANA, LanguageDetector.HIRAGANA_RANGE),
+                    (_SCRIPT_KATAKANA, LanguageDetector.KATAKANA_RANGE),
+                    (_SCRIPT_CJK, LanguageDetector.CJK_UNIFIED_RANGE),
+                ),
+                # A character shared by both sets would say nothing about the script
+                LanguageDetector.TRADITIONAL_INDICATORS - LanguageDetector.SIMPLIFIED_INDICATORS,
+                LanguageDetector.SIMPLIFIED_INDICATORS - LanguageDetector.TRADITIONAL_INDICATORS
+            )
+        return tables
+    
+    @staticmethod
+    def _count_scripts(clean_text: str) -> Tuple[int, int, int, int, int, int]:
+        """
+        Count character classes in one pass over the text
+        Returns: (hiragana, katakana, cjk, ascii, traditional, simplified)
+        """
+        if np is not None and len(clean_text) >= _NUMPY_MIN_CHARS:
+            return LanguageDetector._count_scripts_numpy(clean_text)
+        
+        table = LanguageDetector._script_translate_table
+        if table is None:
+            index, blocks = LanguageDetector._get_script_tables()
+            table = LanguageDetector._script_translate_table = ''.join(
+                chr(blocks[(index[cp >> 8] << 8) | (cp & 0xFF)]) for cp in range(0x10000)
+            )
+        
+        # Map every BMP character to its flags character and tally those, both
+        # in C; characters beyond the BMP are left as-is and skipped below
+        histogram = [0] * 64
+        for flags_char, count in Counter(clean_text.translate(table)).items():
+            flags = ord(flags_char)
+            if flags < 64:
+                histogram[flags] = count
+        
+        return _unpack_script_histogram(histogram)
+    
+    @staticmethod
+    def _count_scripts_numpy(clean_text: str) -> Tuple[int, int, int, int, int, int]:
+        """_count_scripts over a code point array, for long texts"""
+        index, blocks = LanguageDetector._get_script_tables()
+        cp = np.frombuffer(clean_text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        cp = cp[cp <= 0xFFFF]
+        
+        index_arr = np.frombuffer(index, dtype=np.uint8).astype(np.intp)
+        blocks_arr = np.frombuffer(blocks, dtype=np.uint8)
+        flags = blocks_arr[(index_arr[cp >> 8] << 8) | (cp & 0xFF)]
+        
+        return _unpack_script_histogram(np.bincount(flags, minlength=64).tolist())
+    
     @staticmethod
     def normalize_lang_code(lang_code: str) -> str:
         """Normalize language codes to our standard format"""
@@ -231,42 +568,45 @@ class LanguageDetector:
         lang_code = lang_code.lower().strip()
         
         # Handle common variations
-        mapping = {
-            'chinese': 'zh-CN',
-            'mandarin': 'zh-CN',
-            'simplified': 'zh-CN',
-            'traditional': 'zh-TW',
-            'cantonese': 'zh-TW',
-            'japanese': 'ja',
-            'english': 'en',
-            'zh': 'zh-CN',  # Default Chinese to Simplified
-            'cn': 'zh-CN',
-            'tw': 'zh-TW',
-            'hk': 'zh-TW',
-            'jp': 'ja',
-        }
-        
-        return mapping.get(lang_code, lang_code)
+        return _LANG_NORMALIZE.get(lang_code, lang_code)
     
     @staticmethod
     def analyze_subtitle_file(subtitle_path: str, declared_lang: Optional[str] = None) -> Dict:
+        """Analyze entire subtitle file for language detection, reusing results while the file is unchanged"""
+        try:
+            stat = os.stat(subtitle_path)
+        except OSError:
+            return LanguageDetector._analyze_subtitle_file(subtitle_path, declared_lang)
+        
+        # Hand out a copy so callers can't alter the cached result
+        return dict(_cached_analyze_subtitle_file(
+            str(subtitle_path), stat.st_mtime_ns, stat.st_size, declared_lang
+        ))
+    
+    @staticmethod
+    def _analyze_subtitle_file(subtitle_path: str, declared_lang: Optional[str] = None) -> Dict:
         """Analyze entire subtitle file for language detection"""
         try:
-            subs = pysubs2.load(subtitle_path)
-            
-            # Sample up to 50 lines for analysis (performance)
-            sample_lines = subs[:50] if len(subs) > 50 else subs
-            
-            # Combine text from multiple lines
-            combined_text = ' '.join([line.text for line in sample_lines if line.text.strip()])
+            # Shared, encoding-aware load: the dual subtitle build that follows
+            # detection reuses this parse from the load cache
+            subs = SubtitleService.load_subtitle(subtitle_path)
             
-            # Remove common subtitle formatting
-            clean_text = re.sub(r'<[^>]+>', '', combined_text)  # Remove HTML tags
-            clean_text = re.sub(r'\{[^}]+\}', '', clean_text)   # Remove ASS formatting
-            clean_text = re.sub(r'\\N', ' ', clean_text)        # Remove ASS line breaks
+            # Sample lines until there is enough text to classify (performance)
+            sample_texts = []
+            sample_lines = sample_chars = 0
+            for line in islice(subs, LanguageDetector.SAMPLE_MAX_LINES):
+                sample_lines += 1
+                if not line.text.strip():
+                    continue
+                # Remove HTML/ASS formatting in one scan, then ASS line breaks
+                text = _SUBTITLE_TAG_RE.sub('', line.text).replace('\\N', ' ')
+                sample_texts.append(text)
+                sample_chars += len(text)
+                if sample_chars >= LanguageDetector.SAMPLE_TARGET_CHARS:
+                    break
             
-            result = LanguageDetector.detect_language(clean_text, declared_lang)
-            result['sample_lines'] = len(sample_lines)
+            result = LanguageDetector.detect_language(' '.join(sample_texts), declared_lang)
+            result['sample_lines'] = sample_lines
             result['total_lines'] = len(subs)
             
             return result
@@ -280,21 +620,82 @@ class LanguageDetector:
                 'recommendation': declared_lang or 'en'
             }
 
+@functools.lru_cache(maxsize=256)
+def _cached_analyze_subtitle_file(
+    path: str, mtime_ns: int, size: int, declared_lang: Optional[str]
+) -> Dict:
+    """Subtitle language analysis memoized per file version (path, mtime, size)"""
+    return LanguageDetector._analyze_subtitle_file(path, declared_lang)
+
+@functools.lru_cache(maxsize=32)
+def _cached_load_subtitle(
+    path: str, mtime_ns: int, size: int, encoding: Optional[str]
+) -> pysubs2.SSAFile:
+    """Parsed subtitle file (including encoding detection) memoized per file version"""
+    return SubtitleService._load_subtitle(path, encoding)
+
+@functools.lru_cache(maxsize=256)
+def _cached_video_duration_ms(path: str, mtime_ns: int, size: int) -> int:
+    """Video duration memoized per file version; failures are not cached"""
+    return SubtitleService._probe_video_duration_ms(path)
+
+@functools.lru_cache(maxsize=32)
+def _cached_ass_style(config_fields: Tuple, is_primary: bool) -> pysubs2.SSAStyle:
+    """ASS style for one track, memoized per DualSubtitleConfig field values"""
+    config = DualSubtitleConfig(*config_fields)
+    return pysubs2.SSAStyle(**SubtitleService.create_ass_style("", config, is_primary))
+
+# Finished ffsubsync runs, kept on disk so unchanged pairs skip re-syncing
+_SYNC_CACHE_DIR = Path(
+    os.environ.get('DUALSUB_SYNC_CACHE_DIR') or Path.home() / '.cache' / 'plex-dualsub' / 'ffsubsync'
+)
+_SYNC_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+def _sync_cache_key(reference_path: str, target_path: str) -> str:
+    """Key for a sync result: the reference file's version plus the target's content"""
+    # The reference may be a multi-GB video, so it's identified by stat only
+    stat = os.stat(reference_path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v1|{os.path.abspath(reference_path)}|{stat.st_mtime_ns}|{stat.st_size}|".encode())
+    with open(target_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _read_sync_cache(key: str) -> Optional[bytes]:
+    try:
+        return (_SYNC_CACHE_DIR / f"{key}.srt").read_bytes()
+    except OSError:
+        return None
+
+def _write_sync_cache(key: str, data: bytes):
+    """Store a sync result atomically, dropping the oldest entries past the size limit"""
+    try:
+        _SYNC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_SYNC_CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, _SYNC_CACHE_DIR / f"{key}.srt")
+        
+        entries = [(entry.stat(), entry) for entry in _SYNC_CACHE_DIR.glob('*.srt')]
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+            if total <= _SYNC_CACHE_MAX_BYTES:
+                break
+            entry.unlink()
+            total -= stat.st_size
+    except OSError as e:
+        logger.warning("Could not cache sync result: %s", e)
+
 class SubtitleService:
     
     # Language-specific font mapping for better CJK support
-    LANGUAGE_FONTS = {
-        'ja': ['NotoSansCJK-Regular', 'Hiragino Sans', 'MS Gothic', 'Arial Unicode MS', 'Arial'],
-        'zh-CN': ['NotoSansCJK-Regular', 'Microsoft YaHei', 'SimSun', 'Arial Unicode MS', 'Arial'],
-        'zh-TW': ['NotoSansCJK-Regular', 'Microsoft JhengHei', 'PMingLiU', 'Arial Unicode MS', 'Arial'],
-        'en': ['Arial', 'Helvetica', 'sans-serif'],
-        'default': ['Arial', 'sans-serif']
-    }
+    LANGUAGE_FONTS = _LANGUAGE_FONTS
     
     @staticmethod
     def get_optimal_font(language: str) -> str:
         """Get the best font for a given language"""
-        return SubtitleService.LANGUAGE_FONTS.get(language, SubtitleService.LANGUAGE_FONTS['default'])[0]
+        return _OPTIMAL_FONTS.get(language) or _OPTIMAL_FONTS['default']
     
     @staticmethod
     def detect_and_enhance_config(primary_path: str, secondary_path: str, config: DualSubtitleConfig, 
@@ -304,29 +705,15 @@ class SubtitleService:
         Detect languages and enhance configuration with language-specific optimizations
         Returns: (enhanced_config, detection_report)
         """
-        # Detect languages
-        primary_analysis = LanguageDetector.analyze_subtitle_file(primary_path, declared_primary_lang)
+        # Detect languages, analyzing the primary in the background meanwhile
+        primary_future = _io_pool.submit(
+            LanguageDetector.analyze_subtitle_file, primary_path, declared_primary_lang
+        )
         secondary_analysis = LanguageDetector.analyze_subtitle_file(secondary_path, declared_secondary_lang)
+        primary_analysis = primary_future.result()
         
         # Create enhanced config copy
-        enhanced_config = DualSubtitleConfig(
-            primary_position=config.primary_position,
-            secondary_position=config.secondary_position,
-            primary_color=config.primary_color,
-            secondary_color=config.secondary_color,
-            primary_font_size=config.primary_font_size,
-            secondary_font_size=config.secondary_font_size,
-            primary_margin_v=config.primary_margin_v,
-            secondary_margin_v=config.secondary_margin_v,
-            output_format=config.output_format,
-            bold=config.bold,
-            italic=config.italic,
-            border_style=config.border_style,
-            outline_width=config.outline_width,
-            shadow_depth=config.shadow_depth,
-            srt_primary_prefix=config.srt_primary_prefix,
-            srt_secondary_prefix=config.srt_secondary_prefix,
-        )
+        enhanced_config = replace(config)
         
         # Apply language-specific enhancements
         primary_lang = primary_analysis['recommendation']
@@ -376,26 +763,31 @@ class SubtitleService:
     @staticmethod
     def get_language_prefix(lang_code: str) -> str:
         """Get appropriate SRT prefix for language"""
-        prefixes = {
-            'en': '[EN] ',
-            'ja': '[JA] ',
-            'zh-CN': '[CN] ',
-            'zh-TW': '[TW] ',
-            'ko': '[KO] ',
-            'fr': '[FR] ',
-            'es': '[ES] ',
-            'de': '[DE] ',
-        }
-        return prefixes.get(lang_code, f'[{lang_code.upper()}] ')
+        prefix = _LANG_PREFIXES.get(lang_code)
+        if prefix is None:
+            prefix = f'[{lang_code.upper()}] '
+        return prefix
     
     @staticmethod
-    def extract_embedded_subtitle(video_path: str, stream_index: int, output_path: str, codec: str = None) -> Dict:
-        """Extract an embedded subtitle stream from video file, preserving format when possible"""
+    def extract_embedded_subtitle(video_path: str, stream_index: int, output_path: Optional[str] = None, codec: str = None) -> Dict:
+        """
+        Extract an embedded subtitle stream from video file, preserving format when possible
+        
+        Without output_path the stream is piped out of ffmpeg and returned as
+        'content' instead of being written to disk.
+        """
+        import ffmpeg  # Only needed for extraction
+        
         try:
-            print(f"Extracting subtitle: video_path={video_path}, stream_index={stream_index}, output_path={output_path}, codec={codec}")
+            logger.debug("Extracting subtitle: video_path=%s, stream_index=%s, output_path=%s, codec=%s",
+                         video_path, stream_index, output_path, codec)
             
             # Determine output format based on codec and file extension
-            output_ext = Path(output_path).suffix.lower()
+            if output_path is None:
+                # Piped output has no extension, so keep the codec's own format
+                output_ext = f".{codec.lower()}" if codec else '.srt'
+            else:
+                output_ext = Path(output_path).suffix.lower()
             
             # If codec is ASS/SSA and output path has .ass extension, preserve format
             if codec and codec.lower() in ['ass', 'ssa'] and output_ext == '.ass':
@@ -412,12 +804,21 @@ class SubtitleService:
             input_stream = ffmpeg.input(video_path)
             output = ffmpeg.output(
                 input_stream, 
-                output_path,
+                output_path if output_path is not None else 'pipe:',
                 **{'map': f'0:{stream_index}', 'f': output_format}
             )
             
+            if output_path is None:
+                content, _ = ffmpeg.run(output, capture_stdout=True, capture_stderr=True)
+                return {
+                    'success': True,
+                    'content': content.decode('utf-8', errors='replace'),
+                    'format': output_format,
+                    'stream_index': stream_index
+                }
+            
             # Run with verbose output for debugging
-            print(f"Running ffmpeg command: {ffmpeg.compile(output)}")
+            logger.debug("Running ffmpeg command: %s", ffmpeg.compile(output))
             ffmpeg.run(output, overwrite_output=True, quiet=False)
             
             return {
@@ -427,14 +828,14 @@ class SubtitleService:
             }
         except ffmpeg.Error as e:
             error_msg = f"FFmpeg error: {e.stderr.decode() if e.stderr else str(e)}"
-            print(f"FFmpeg extraction failed: {error_msg}")
+            logger.warning("FFmpeg extraction failed: %s", error_msg)
             return {
                 'success': False,
                 'error': error_msg
             }
         except Exception as e:
             error_msg = f"General error: {str(e)}"
-            print(f"Extraction failed: {error_msg}")
+            logger.warning("Extraction failed: %s", error_msg)
             return {
                 'success': False,
                 'error': error_msg
@@ -442,15 +843,26 @@ class SubtitleService:
     
     @staticmethod
     def get_video_duration_ms(video_path: str) -> Optional[int]:
-        """Get video duration in milliseconds using ffmpeg"""
+        """Get video duration in milliseconds using ffprobe (cached per file version)"""
         try:
-            probe = ffmpeg.probe(video_path)
-            duration = float(probe['streams'][0]['duration'])
-            return int(duration * 1000)
+            stat = os.stat(video_path)
+            return _cached_video_duration_ms(str(video_path), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
-            print(f"Warning: Could not get video duration: {e}")
+            logger.warning("Could not get video duration: %s", e)
             return None
     
+    @staticmethod
+    def _probe_video_duration_ms(video_path: str) -> int:
+        """Video duration in milliseconds from ffprobe; raises on failure"""
+        # Ask only for the container duration instead of the full probe JSON
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'csv=p=0', video_path],
+            capture_output=True, text=True, timeout=10, check=True
+        )
+        duration = float(result.stdout.strip())
+        return int(duration * 1000)
+    
     @staticmethod
     def validate_subtitle_sync(subtitle_path: str, video_path: str) -> Dict:
         """Check if subtitle timing matches video duration"""
@@ -467,7 +879,7 @@ class SubtitleService:
                 return {'valid': False, 'error': 'No subtitles found'}
             
             # Get last subtitle end time
-            last_subtitle_end = max(line.end for line in subs)
+            last_subtitle_end = max(map(_get_end, subs.events))
             
             # Check if subtitles extend beyond video
             if last_subtitle_end > video_duration_ms + 5000:  # 5 second tolerance
@@ -499,10 +911,40 @@ class SubtitleService:
             return {'valid': False, 'error': str(e)}
     
     @staticmethod
-    def sync_subtitles_with_ffsubsync(reference_path: str, target_path: str, output_path: str) -> Dict:
-        """Synchronize target subtitle file to reference using ffsubsync"""
+    def sync_subtitles_with_ffsubsync(reference_path: str, target_path: str, output_path: Optional[str] = None) -> Dict:
+        """
+        Synchronize target subtitle file to reference using ffsubsync
+        
+        Without output_path, ffsubsync writes to stdout and the synchronized
+        subtitle text is returned as 'content' instead of going through a file.
+        """
         try:
-            print(f"Synchronizing {Path(target_path).name} to {Path(reference_path).name}...")
+            logger.info("Synchronizing %s to %s...", Path(target_path).name, Path(reference_path).name)
+            
+            # Reuse an earlier run for the same reference and target
+            try:
+                cache_key = _sync_cache_key(reference_path, target_path)
+            except OSError:
+                cache_key = None
+            cached = _read_sync_cache(cache_key) if cache_key else None
+            if cached is not None:
+                logger.info("Using cached synchronization for %s", Path(target_path).name)
+                if output_path is None:
+                    return {
+                        'success': True,
+                        'synchronized': True,
+                        'content': cached.decode('utf-8', errors='replace'),
+                        'method': 'ffsubsync',
+                        'cached': True
+                    }
+                Path(output_path).write_bytes(cached)
+                return {
+                    'success': True,
+                    'synchronized': True,
+                    'output_path': output_path,
+                    'method': 'ffsubsync',
+                    'cached': True
+                }
             
             # Check if ffsubsync is available
             try:
@@ -526,17 +968,38 @@ class SubtitleService:
                 'ffsubsync',
                 str(reference_path),
                 '-i', str(target_path),
-                '-o', str(output_path),
                 '--max-offset-seconds', '60',  # Allow up to 60 seconds offset
                 '--no-fix-framerate'  # Don't change framerate
             ]
+            if output_path is not None:
+                cmd[4:4] = ['-o', str(output_path)]
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            # ffsubsync writes UTF-8 output by default
+            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8',
+                                    errors='replace', timeout=120)
             
-            if result.returncode == 0:
+            if result.returncode == 0 and output_path is None:
+                if result.stdout.strip():
+                    logger.info("Successfully synchronized %s!", Path(target_path).name)
+                    if cache_key:
+                        _write_sync_cache(cache_key, result.stdout.encode('utf-8'))
+                    return {
+                        'success': True,
+                        'synchronized': True,
+                        'content': result.stdout,
+                        'method': 'ffsubsync'
+                    }
+                return {
+                    'success': False,
+                    'error': 'ffsubsync completed but produced no output',
+                    'fallback_available': True
+                }
+            elif result.returncode == 0:
                 # Verify output file was created and has content
                 if Path(output_path).exists() and Path(output_path).stat().st_size > 0:
-                    print(f"Successfully synchronized {Path(target_path).name}!")
+                    logger.info("Successfully synchronized %s!", Path(target_path).name)
+                    if cache_key:
+                        _write_sync_cache(cache_key, Path(output_path).read_bytes())
                     return {
                         'success': True,
                         'synchronized': True,
@@ -551,7 +1014,7 @@ class SubtitleService:
                     }
             else:
                 error_msg = result.stderr.strip() if result.stderr else 'Unknown ffsubsync error'
-                print(f"ffsubsync failed: {error_msg}")
+                logger.warning("ffsubsync failed: %s", error_msg)
                 return {
                     'success': False,
                     'error': f'ffsubsync failed: {error_msg}',
@@ -575,7 +1038,8 @@ class SubtitleService:
     def adjust_subtitle_timing(subtitle_path: str, offset_ms: int, output_path: str) -> Dict:
         """Adjust subtitle timing by offset (positive = delay, negative = advance)"""
         try:
-            subs = SubtitleService.load_subtitle(subtitle_path)
+            # Copy, since the loaded file is shared through the load cache
+            subs = SubtitleService.copy_subtitles(SubtitleService.load_subtitle(subtitle_path))
             
             # Apply offset to all subtitles
             for line in subs:
@@ -604,13 +1068,113 @@ class SubtitleService:
     @staticmethod
     def detect_encoding(file_path: str) -> str:
         """Detect the character encoding of a subtitle file"""
+        import chardet  # Only needed when no encoding is given
+        
+        # Feed the detector in chunks and stop as soon as it is confident
+        detector = chardet.UniversalDetector()
         with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
-            return result['encoding'] or 'utf-8'
+            for chunk in iter(lambda: f.read(65536), b''):
+                detector.feed(chunk)
+                if detector.done:
+                    break
+        detector.close()
+        return detector.result['encoding'] or 'utf-8'
     
     @staticmethod
     def load_subtitle(file_path: str, encoding: Optional[str] = None) -> pysubs2.SSAFile:
+        """
+        Load a subtitle file with automatic encoding detection
+        
+        Parsed files are cached per file version and shared between callers,
+        so treat the result as read-only; use copy_subtitles before mutating.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return SubtitleService._load_subtitle(file_path, encoding)
+        return _cached_load_subtitle(str(file_path), stat.st_mtime_ns, stat.st_size, encoding)
+    
+    @staticmethod
+    def load_subtitle_head(file_path: str, count: int, encoding: Optional[str] = None) -> pysubs2.SSAFile:
+        """
+        Load only the first `count` events of an SRT/ASS/SSA file
+        
+        Reads the file line by line and stops once enough events are seen, so
+        previews of very large files don't parse the whole thing. Events match
+        those of a full load_subtitle; other formats fall back to it.
+        """
+        suffix = Path(file_path).suffix.lower()
+        if suffix not in ('.srt', '.ass', '.ssa'):
+            subs = SubtitleService.load_subtitle(file_path, encoding)
+            head = pysubs2.SSAFile()
+            head.events = subs.events[:count]
+            return head
+        
+        if not encoding:
+            encoding = SubtitleService.detect_encoding(file_path)
+        
+        try:
+            text = SubtitleService._read_subtitle_head(file_path, suffix, count, encoding, 'strict')
+        except (UnicodeDecodeError, LookupError):
+            text = SubtitleService._read_subtitle_head(file_path, suffix, count, 'utf-8', 'replace')
+        
+        subs = pysubs2.SSAFile.from_string(text, format_='srt' if suffix == '.srt' else 'ass')
+        subs.events = subs.events[:count]
+        return subs
+    
+    @staticmethod
+    def _read_subtitle_head(file_path: str, suffix: str, count: int, encoding: str, errors: str) -> str:
+        """Leading text of a subtitle file holding its first `count` events"""
+        lines = []
+        with open(file_path, encoding=encoding, errors=errors) as f:
+            if suffix == '.srt':
+                # Keep the timestamp line after the last wanted cue so its
+                # text ends (and its trailing cue number is dropped) as in a
+                # full parse
+                timestamp = SubripFormat.TIMESTAMP
+                seen = 0
+                for line in f:
+                    lines.append(line)
+                    if len(timestamp.findall(line)) == 2:
+                        seen += 1
+                        if seen > count:
+                            break
+            else:
+                in_events = False
+                seen = 0
+                for line in f:
+                    if seen >= count:
+                        break
+                    lines.append(line)
+                    stripped = line.lstrip()
+                    if stripped.startswith('['):
+                        in_events = stripped.lower().startswith('[events]')
+                    elif in_events and stripped.startswith(('Dialogue:', 'Comment:')):
+                        seen += 1
+        return ''.join(lines)
+    
+    @staticmethod
+    def clear_cache():
+        """Drop cached parsed subtitles and language analyses"""
+        _cached_load_subtitle.cache_clear()
+        _cached_analyze_subtitle_file.cache_clear()
+    
+    @staticmethod
+    def copy_subtitles(subs: pysubs2.SSAFile) -> pysubs2.SSAFile:
+        """Independent copy of a subtitle file, safe to mutate"""
+        copied = pysubs2.SSAFile()
+        copied.info = dict(subs.info)
+        copied.aegisub_project = dict(subs.aegisub_project)
+        copied.styles = {name: style.copy() for name, style in subs.styles.items()}
+        copied.events = [line.copy() for line in subs.events]
+        copied.fonts_opaque = dict(subs.fonts_opaque)
+        copied.graphics_opaque = dict(subs.graphics_opaque)
+        copied.format = subs.format
+        copied.fps = subs.fps
+        return copied
+    
+    @staticmethod
+    def _load_subtitle(file_path: str, encoding: Optional[str] = None) -> pysubs2.SSAFile:
         """Load a subtitle file with automatic encoding detection"""
         if not encoding:
             encoding = SubtitleService.detect_encoding(file_path)
@@ -635,10 +1199,10 @@ class SubtitleService:
             g = hex_color[2:4]
             b = hex_color[4:6]
             ass_color = f"&H{b}{g}{r}"
-            print(f"Color conversion: {hex_color} -> {ass_color}")
+            logger.debug("Color conversion: %s -> %s", hex_color, ass_color)
             return ass_color
         
-        print(f"Invalid color format: {hex_color}, using white")
+        logger.warning("Invalid color format: %s, using white", hex_color)
         return "&HFFFFFF"  # Default to white
     
     @staticmethod
@@ -710,166 +1274,109 @@ class SubtitleService:
         """Create a dual subtitle in ASS format with full customization and optional synchronization"""
         
         sync_report = {'attempted': False, 'successful': False, 'primary_synced': False, 'secondary_synced': False}
-        actual_primary_path = primary_path
-        actual_secondary_path = secondary_path
+        # Synchronized subtitles come back from ffsubsync in memory
+        primary_subs = None
+        secondary_subs = None
+        primary_future = None
         
         # Attempt synchronization if enabled and video is available
         if enable_sync and video_path and Path(video_path).exists():
             try:
                 sync_report['attempted'] = True
                 
-                # Sync PRIMARY subtitle to video first
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp_file:
-                    temp_primary_sync_path = tmp_file.name
-                
-                primary_sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
-                    video_path, primary_path, temp_primary_sync_path
+                # Sync both subtitles to the video; the ffsubsync runs are
+                # independent, so the primary's runs in the background
+                primary_sync_future = _io_pool.submit(
+                    SubtitleService.sync_subtitles_with_ffsubsync, video_path, primary_path
+                )
+                secondary_sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
+                    video_path, secondary_path
                 )
+                primary_sync_result = primary_sync_future.result()
                 
                 if primary_sync_result['success']:
-                    actual_primary_path = temp_primary_sync_path
+                    primary_subs = pysubs2.SSAFile.from_string(primary_sync_result['content'])
                     sync_report['primary_synced'] = True
-                    print(f"Primary subtitle synced to video")
+                    logger.info("Primary subtitle synced to video")
                 else:
-                    print(f"Primary sync failed: {primary_sync_result['error']}")
-                    # Clean up temp file if sync failed
-                    try:
-                        Path(temp_primary_sync_path).unlink()
-                    except:
-                        pass
-                
-                # Sync SECONDARY subtitle to video
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp_file:
-                    temp_secondary_sync_path = tmp_file.name
-                
-                secondary_sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
-                    video_path, secondary_path, temp_secondary_sync_path
-                )
+                    logger.warning("Primary sync failed: %s", primary_sync_result['error'])
                 
                 if secondary_sync_result['success']:
-                    actual_secondary_path = temp_secondary_sync_path
+                    secondary_subs = pysubs2.SSAFile.from_string(secondary_sync_result['content'])
                     sync_report['secondary_synced'] = True
-                    print(f"Secondary subtitle synced to video")
+                    logger.info("Secondary subtitle synced to video")
                 else:
-                    print(f"Secondary sync failed: {secondary_sync_result['error']}")
-                    # Clean up temp file if sync failed
-                    try:
-                        Path(temp_secondary_sync_path).unlink()
-                    except:
-                        pass
+                    logger.warning("Secondary sync failed: %s", secondary_sync_result['error'])
                 
                 sync_report['successful'] = sync_report['primary_synced'] or sync_report['secondary_synced']
                 sync_report['method'] = 'ffsubsync-to-video'
                     
             except Exception as e:
                 sync_report['error'] = str(e)
-                print(f"Video synchronization attempt failed: {e}")
+                logger.warning("Video synchronization attempt failed: %s", e)
         
         elif enable_sync and not video_path:
             # Fallback: Try to sync secondary to primary if no video available
             try:
                 sync_report['attempted'] = True
                 
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp_file:
-                    temp_sync_path = tmp_file.name
+                # The primary is only the reference here, so parse it while
+                # ffsubsync runs
+                primary_future = _io_pool.submit(SubtitleService.load_subtitle, primary_path)
                 
                 # This is less reliable but better than nothing
                 sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
-                    primary_path, secondary_path, temp_sync_path
+                    primary_path, secondary_path
                 )
                 
                 if sync_result['success']:
-                    actual_secondary_path = temp_sync_path
+                    secondary_subs = pysubs2.SSAFile.from_string(sync_result['content'])
                     sync_report['secondary_synced'] = True
                     sync_report['successful'] = True
                     sync_report['method'] = 'ffsubsync-subtitle-to-subtitle'
-                    print(f"Secondary subtitle synced to primary (fallback method)")
+                    logger.info("Secondary subtitle synced to primary (fallback method)")
                 else:
                     sync_report['error'] = sync_result['error']
-                    print(f"Subtitle-to-subtitle sync failed: {sync_result['error']}")
-                    # Clean up temp file if sync failed
-                    try:
-                        Path(temp_sync_path).unlink()
-                    except:
-                        pass
+                    logger.warning("Subtitle-to-subtitle sync failed: %s", sync_result['error'])
                     
             except Exception as e:
                 sync_report['error'] = str(e)
-                print(f"Subtitle-to-subtitle synchronization failed: {e}")
+                logger.warning("Subtitle-to-subtitle synchronization failed: %s", e)
         
-        try:
-            # Load both subtitle files (use synced versions if available)
-            primary_subs = SubtitleService.load_subtitle(actual_primary_path)
-            secondary_subs = SubtitleService.load_subtitle(actual_secondary_path)
-            
-            # Create new ASS file
-            dual_subs = pysubs2.SSAFile()
-            
-            # Define styles
-            dual_subs.styles["Primary"] = pysubs2.SSAStyle(**SubtitleService.create_ass_style("Primary", config, True))
-            dual_subs.styles["Secondary"] = pysubs2.SSAStyle(**SubtitleService.create_ass_style("Secondary", config, False))
-            
-            # Add primary subtitles
-            for line in primary_subs:
-                new_line = pysubs2.SSAEvent(
-                    start=line.start,
-                    end=line.end,
-                    text=line.text,
-                    style="Primary"
-                )
-                dual_subs.append(new_line)
-            
-            # Add secondary subtitles
-            for line in secondary_subs:
-                new_line = pysubs2.SSAEvent(
-                    start=line.start,
-                    end=line.end,
-                    text=line.text,
-                    style="Secondary"
-                )
-                dual_subs.append(new_line)
-            
-            # Sort by timestamp
-            dual_subs.sort()
-            
-            # Save the file
-            dual_subs.save(output_path)
-            
-            # Clean up temporary synchronized files
-            if sync_report.get('primary_synced') and actual_primary_path != primary_path:
-                try:
-                    Path(actual_primary_path).unlink()
-                except:
-                    pass
-            if sync_report.get('secondary_synced') and actual_secondary_path != secondary_path:
-                try:
-                    Path(actual_secondary_path).unlink()
-                except:
-                    pass
-            
-            return {
-                'success': True,
-                'output_path': output_path,
-                'primary_lines': len(primary_subs),
-                'secondary_lines': len(secondary_subs),
-                'total_lines': len(dual_subs),
-                'format': 'ASS',
-                'sync_report': sync_report
-            }
-            
-        except Exception as e:
-            # Clean up temporary files on error
-            if sync_report.get('primary_synced') and actual_primary_path != primary_path:
-                try:
-                    Path(actual_primary_path).unlink()
-                except:
-                    pass
-            if sync_report.get('secondary_synced') and actual_secondary_path != secondary_path:
-                try:
-                    Path(actual_secondary_path).unlink()
-                except:
-                    pass
-            raise e
+        # Load whichever subtitle files weren't synchronized
+        if primary_future is not None:
+            primary_subs = primary_future.result()
+        elif primary_subs is None:
+            primary_subs = SubtitleService.load_subtitle(primary_path)
+        if secondary_subs is None:
+            secondary_subs = SubtitleService.load_subtitle(secondary_path)
+        
+        # Create new ASS file
+        dual_subs = pysubs2.SSAFile()
+        
+        # Define styles (cached per config, copied so the file owns them)
+        config_fields = astuple(config)
+        dual_subs.styles["Primary"] = _cached_ass_style(config_fields, True).copy()
+        dual_subs.styles["Secondary"] = _cached_ass_style(config_fields, False).copy()
+        
+        # Add primary and secondary subtitles, merged by timestamp
+        dual_subs.events = merge_sorted_events(
+            _restyled_events(primary_subs, "Primary", owned=sync_report['primary_synced']),
+            _restyled_events(secondary_subs, "Secondary", owned=sync_report['secondary_synced'])
+        )
+        
+        # Save the file
+        dual_subs.save(output_path)
+        
+        return {
+            'success': True,
+            'output_path': output_path,
+            'primary_lines': len(primary_subs),
+            'secondary_lines': len(secondary_subs),
+            'total_lines': len(dual_subs),
+            'format': 'ASS',
+            'sync_report': sync_report
+        }
     
     @staticmethod
     def create_dual_subtitle_srt(
@@ -883,179 +1390,139 @@ class SubtitleService:
         """Create a dual subtitle in SRT format with prefixes and optional synchronization"""
         
         sync_report = {'attempted': False, 'successful': False, 'primary_synced': False, 'secondary_synced': False}
-        actual_primary_path = primary_path
-        actual_secondary_path = secondary_path
+        primary_subs = None
+        secondary_subs = None
+        primary_future = None
         
         # Attempt synchronization if enabled and video is available
         if enable_sync and video_path and Path(video_path).exists():
             try:
                 sync_report['attempted'] = True
                 
-                # Sync PRIMARY subtitle to video first
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp_file:
-                    temp_primary_sync_path = tmp_file.name
-                
-                primary_sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
-                    video_path, primary_path, temp_primary_sync_path
+                # Sync both subtitles to the video; the ffsubsync runs are
+                # independent, so the primary's runs in the background
+                primary_sync_future = _io_pool.submit(
+                    SubtitleService.sync_subtitles_with_ffsubsync, video_path, primary_path
+                )
+                secondary_sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
+                    video_path, secondary_path
                 )
+                primary_sync_result = primary_sync_future.result()
                 
                 if primary_sync_result['success']:
-                    actual_primary_path = temp_primary_sync_path
+                    primary_subs = pysubs2.SSAFile.from_string(primary_sync_result['content'])
                     sync_report['primary_synced'] = True
-                    print(f"Primary subtitle synced to video")
+                    logger.info("Primary subtitle synced to video")
                 else:
-                    print(f"Primary sync failed: {primary_sync_result['error']}")
-                    # Clean up temp file if sync failed
-                    try:
-                        Path(temp_primary_sync_path).unlink()
-                    except:
-                        pass
-                
-                # Sync SECONDARY subtitle to video
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp_file:
-                    temp_secondary_sync_path = tmp_file.name
-                
-                secondary_sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
-                    video_path, secondary_path, temp_secondary_sync_path
-                )
+                    logger.warning("Primary sync failed: %s", primary_sync_result['error'])
                 
                 if secondary_sync_result['success']:
-                    actual_secondary_path = temp_secondary_sync_path
+                    secondary_subs = pysubs2.SSAFile.from_string(secondary_sync_result['content'])
                     sync_report['secondary_synced'] = True
-                    print(f"Secondary subtitle synced to video")
+                    logger.info("Secondary subtitle synced to video")
                 else:
-                    print(f"Secondary sync failed: {secondary_sync_result['error']}")
-                    # Clean up temp file if sync failed
-                    try:
-                        Path(temp_secondary_sync_path).unlink()
-                    except:
-                        pass
+                    logger.warning("Secondary sync failed: %s", secondary_sync_result['error'])
                 
                 sync_report['successful'] = sync_report['primary_synced'] or sync_report['secondary_synced']
                 sync_report['method'] = 'ffsubsync-to-video'
                     
             except Exception as e:
                 sync_report['error'] = str(e)
-                print(f"Video synchronization attempt failed: {e}")
+                logger.warning("Video synchronization attempt failed: %s", e)
         
         elif enable_sync and not video_path:
             # Fallback: Try to sync secondary to primary if no video available
             try:
                 sync_report['attempted'] = True
                 
-                with tempfile.NamedTemporaryFile(suffix='.srt', delete=False) as tmp_file:
-                    temp_sync_path = tmp_file.name
+                # The primary is only the reference here, so parse it while
+                # ffsubsync runs
+                primary_future = _io_pool.submit(SubtitleService.load_subtitle, primary_path)
                 
                 # This is less reliable but better than nothing
                 sync_result = SubtitleService.sync_subtitles_with_ffsubsync(
-                    primary_path, secondary_path, temp_sync_path
+                    primary_path, secondary_path
                 )
                 
                 if sync_result['success']:
-                    actual_secondary_path = temp_sync_path
+                    secondary_subs = pysubs2.SSAFile.from_string(sync_result['content'])
                     sync_report['secondary_synced'] = True
                     sync_report['successful'] = True
                     sync_report['method'] = 'ffsubsync-subtitle-to-subtitle'
-                    print(f"Secondary subtitle synced to primary (fallback method)")
+                    logger.info("Secondary subtitle synced to primary (fallback method)")
                 else:
                     sync_report['error'] = sync_result['error']
-                    print(f"Subtitle-to-subtitle sync failed: {sync_result['error']}")
-                    # Clean up temp file if sync failed
-                    try:
-                        Path(temp_sync_path).unlink()
-                    except:
-                        pass
-                        
+                    logger.warning("Subtitle-to-subtitle sync failed: %s", sync_result['error'])
+                    
             except Exception as e:
                 sync_report['error'] = str(e)
-                print(f"Subtitle-to-subtitle synchronization failed: {e}")
+                logger.warning("Subtitle-to-subtitle synchronization failed: %s", e)
         
-        try:
-            # Load both subtitle files (use synced versions if available)
-            primary_subs = SubtitleService.load_subtitle(actual_primary_path)
-            secondary_subs = SubtitleService.load_subtitle(actual_secondary_path)
-            
-            # Create new SRT file
-            dual_subs = pysubs2.SSAFile()
-            
-            # Add primary subtitles with prefix
-            for line in primary_subs:
-                text = line.text
-                if config.srt_primary_prefix:
-                    text = config.srt_primary_prefix + text
-                
-                new_line = pysubs2.SSAEvent(
-                    start=line.start,
-                    end=line.end,
-                    text=text
-                )
-                dual_subs.append(new_line)
-            
-            # Add secondary subtitles with prefix  
-            for line in secondary_subs:
-                text = line.text
-                if config.srt_secondary_prefix:
-                    text = config.srt_secondary_prefix + text
-                    
-                # For SRT, combine with existing subtitle at same time if overlap
-                overlapping = False
-                for existing in dual_subs:
-                    if (existing.start <= line.start <= existing.end or 
-                        existing.start <= line.end <= existing.end):
-                        # Add secondary as new line in same subtitle
-                        existing.text = f"{existing.text}\\N{text}"
-                        overlapping = True
-                        break
+        # Load whichever subtitle files weren't synchronized
+        if primary_future is not None:
+            primary_subs = primary_future.result()
+        elif primary_subs is None:
+            primary_subs = SubtitleService.load_subtitle(primary_path)
+        if secondary_subs is None:
+            secondary_subs = SubtitleService.load_subtitle(secondary_path)
+        
+        # Add primary subtitles with prefix; events are collected in a plain
+        # list and only wrapped in an SSAFile for saving
+        SSAEvent = pysubs2.SSAEvent
+        primary_prefix = config.srt_primary_prefix or ''
+        secondary_prefix = config.srt_secondary_prefix or ''
+        events = [
+            SSAEvent(start=line.start, end=line.end, text=text)
+            for line, text in zip(primary_subs, _prefixed_texts(primary_subs.events, primary_prefix))
+        ]
+        
+        # Containing primaries for every secondary line at once when the
+        # primaries allow it; the index then only tracks added secondaries
+        primary_count = len(events)
+        primary_hits = _first_primary_hits(events, secondary_subs.events)
+        placed = _EventIntervalIndex()
+        if primary_hits is None:
+            placed.add_all(events)
+        first_containing = placed.first_containing
+        add_placed = placed.add
+        append = events.append
+        
+        # Add secondary subtitles with prefix  
+        secondary_texts = _prefixed_texts(secondary_subs.events, secondary_prefix)
+        for line, text, primary_hit in zip(secondary_subs, secondary_texts, primary_hits or repeat(-1)):
+            start, end = line.start, line.end
                 
-                if not overlapping:
-                    new_line = pysubs2.SSAEvent(
-                        start=line.start,
-                        end=line.end,
-                        text=text
-                    )
-                    dual_subs.append(new_line)
-            
-            # Sort by timestamp
-            dual_subs.sort()
-            
-            # Save as SRT
-            dual_subs.save(output_path, format_='srt')
-            
-            # Clean up temporary synchronized files
-            if sync_report.get('primary_synced') and actual_primary_path != primary_path:
-                try:
-                    Path(actual_primary_path).unlink()
-                except:
-                    pass
-            if sync_report.get('secondary_synced') and actual_secondary_path != secondary_path:
-                try:
-                    Path(actual_secondary_path).unlink()
-                except:
-                    pass
-            
-            return {
-                'success': True,
-                'output_path': output_path,
-                'primary_lines': len(primary_subs),
-                'secondary_lines': len(secondary_subs),
-                'total_lines': len(dual_subs),
-                'format': 'SRT',
-                'sync_report': sync_report
-            }
-            
-        except Exception as e:
-            # Clean up temporary files on error
-            if sync_report.get('primary_synced') and actual_primary_path != primary_path:
-                try:
-                    Path(actual_primary_path).unlink()
-                except:
-                    pass
-            if sync_report.get('secondary_synced') and actual_secondary_path != secondary_path:
-                try:
-                    Path(actual_secondary_path).unlink()
-                except:
-                    pass
-            raise e
+            # For SRT, combine with the first placed subtitle whose span
+            # contains this line's start or end
+            if primary_hit >= 0:
+                existing_index = primary_hit
+            else:
+                existing_index = first_containing(start, end)
+            if existing_index is not None:
+                # Add secondary as new line in same subtitle
+                existing = events[existing_index]
+                existing.text = f"{existing.text}\\N{text}"
+            else:
+                add_placed(start, end, len(events))
+                append(SSAEvent(start=start, end=end, text=text))
+        
+        # Merge primaries with the unmatched secondaries by timestamp
+        events = merge_sorted_events(events[:primary_count], events[primary_count:])
+        
+        # Save as SRT
+        dual_subs = pysubs2.SSAFile()
+        dual_subs.events = events
+        save_srt(dual_subs, output_path)
+        
+        return {
+            'success': True,
+            'output_path': output_path,
+            'primary_lines': len(primary_subs),
+            'secondary_lines': len(secondary_subs),
+            'total_lines': len(events),
+            'format': 'SRT',
+            'sync_report': sync_report
+        }
     
     @staticmethod
     def create_dual_subtitle(
@@ -1081,6 +1548,9 @@ class SubtitleService:
         elif output_ext in ['.ass', '.ssa']:
             config.output_format = SubtitleFormat.ASS
         
+        # Start probing the video now so ffprobe runs during language detection
+        video_probe = _io_pool.submit(SubtitleService.get_video_duration_ms, video_path) if video_path else None
+        
         # Enhance configuration with language detection
         detection_report = None
         if enable_language_detection:
@@ -1095,8 +1565,14 @@ class SubtitleService:
         # Validate sync with video if provided
         sync_warnings = []
         if video_path:
+            # With the video probed (and cached), the two checks only need
+            # their subtitle files, already parsed by language detection
+            video_probe.result()
+            secondary_future = _io_pool.submit(
+                SubtitleService.validate_subtitle_sync, secondary_path, video_path
+            )
             primary_sync = SubtitleService.validate_subtitle_sync(primary_path, video_path)
-            secondary_sync = SubtitleService.validate_subtitle_sync(secondary_path, video_path)
+            secondary_sync = secondary_future.result()
             
             if not primary_sync.get('valid'):
                 sync_warnings.append(f"Primary subtitle sync issue: {primary_sync.get('warning', primary_sync.get('error'))}")
@@ -1133,6 +1609,32 @@ class SubtitleService:
                 'sync_warnings': sync_warnings if sync_warnings else None
             }
     
+    @staticmethod
+    def create_dual_subtitles_batch(jobs: List[Dict], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Create several dual subtitles in parallel worker processes
+        
+        Each job is a dict of create_dual_subtitle keyword arguments. Parsing
+        is CPU-bound, so episodes fan out across processes rather than
+        threads; the worker count also caps how many ffsubsync runs overlap.
+        Results come back in job order, with failed jobs reported as errors.
+        Workers are spawned, so scripts calling this need a __main__ guard.
+        """
+        if not jobs:
+            return []
+        
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_batch_mp_context) as executor:
+            futures = [executor.submit(SubtitleService.create_dual_subtitle, **job) for job in jobs]
+        
+        results = []
+        for index, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({'success': False, 'error': str(e), 'job_index': index})
+        return results
+    
     @staticmethod
     def preview_dual_subtitle(
         primary_path: str,
@@ -1145,32 +1647,34 @@ class SubtitleService:
         if config is None:
             config = DualSubtitleConfig()
         
-        # Load subtitles
-        primary_subs = SubtitleService.load_subtitle(primary_path)
-        secondary_subs = SubtitleService.load_subtitle(secondary_path)
+        # Load just the lines being previewed
+        primary_subs = SubtitleService.load_subtitle_head(primary_path, preview_lines)
+        secondary_subs = SubtitleService.load_subtitle_head(secondary_path, preview_lines)
         
         # Get first few lines
-        primary_preview = []
-        for i, line in enumerate(primary_subs):
-            if i >= preview_lines:
-                break
-            primary_preview.append({
-                'time': f"{pysubs2.time.ms_to_str(line.start)} --> {pysubs2.time.ms_to_str(line.end)}",
-                'text': line.text
-            })
-        
-        secondary_preview = []
-        for i, line in enumerate(secondary_subs):
-            if i >= preview_lines:
-                break
-            secondary_preview.append({
-                'time': f"{pysubs2.time.ms_to_str(line.start)} --> {pysubs2.time.ms_to_str(line.end)}",
-                'text': line.text
-            })
+        ms_to_str = pysubs2.time.ms_to_str
+        primary_preview = [
+            {'time': f"{ms_to_str(line.start)} --> {ms_to_str(line.end)}", 'text': line.text}
+            for line in primary_subs.events[:preview_lines]
+        ]
+        secondary_preview = [
+            {'time': f"{ms_to_str(line.start)} --> {ms_to_str(line.end)}", 'text': line.text}
+            for line in secondary_subs.events[:preview_lines]
+        ]
+        
+        # Both tracks interleaved by start time, primary first on ties, as
+        # they will play together
+        timeline = sorted(
+            [(line.start, 'primary', entry) for line, entry in zip(primary_subs, primary_preview)] +
+            [(line.start, 'secondary', entry) for line, entry in zip(secondary_subs, secondary_preview)],
+            key=operator.itemgetter(0)
+        )
+        merged_preview = [dict(entry, track=track) for _, track, entry in timeline[:preview_lines]]
         
         return {
             'primary': primary_preview,
             'secondary': secondary_preview,
+            'merged': merged_preview,
             'config': {
                 'primary_position': config.primary_position.value,
                 'primary_color': config.primary_color,
@@ -2,15 +2,21 @@
 Plugin architecture for subtitle synchronization methods
 """
 
+import atexit
 import subprocess
 import shutil
+import os
+import multiprocessing
+import functools
 import tempfile
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import operator
 import pysubs2
 # Add backend directory to path
 backend_dir = Path(__file__).parent.parent
@@ -23,6 +29,60 @@ from exceptions import (
     SubtitleFormatError
 )
 from config import settings
+from compat import DATACLASS_SLOTS
+
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized offset application for long files
+    np = None
+
+# Batch workers are spawned, not forked, so they never inherit the parent's
+# thread pools (e.g. the subtitle I/O pools) in an unusable state
+_batch_mp_context = multiprocessing.get_context("spawn")
+
+# Below this many lines a plain loop beats numpy's array round trip
+_NUMPY_MIN_LINES = 512
+
+_get_start = operator.attrgetter('start')
+_get_end = operator.attrgetter('end')
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_load_reference(path: str, mtime_ns: int, size: int) -> pysubs2.SSAFile:
+    """Parsed reference subtitle, memoized per file version; never mutate it"""
+    return pysubs2.load(path)
+
+
+def _load_reference(path: str) -> pysubs2.SSAFile:
+    """Load a read-only reference subtitle, reusing the parse while the file is unchanged"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return pysubs2.load(path)
+    return _cached_load_reference(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _shift_subtitles(subs: pysubs2.SSAFile, offset_ms: int):
+    """Shift every line by offset_ms in place, clamping times at zero"""
+    events = subs.events
+    count = len(events)
+    if np is not None and count >= _NUMPY_MIN_LINES and isinstance(offset_ms, int):
+        starts = np.fromiter(map(_get_start, events), dtype=np.int64, count=count)
+        ends = np.fromiter(map(_get_end, events), dtype=np.int64, count=count)
+        starts += offset_ms
+        ends += offset_ms
+        np.maximum(starts, 0, out=starts)
+        np.maximum(ends, 0, out=ends)
+        for line, start, end in zip(events, starts.tolist(), ends.tolist()):
+            line.start = start
+            line.end = end
+        return
+    
+    for line in events:
+        start = line.start + offset_ms
+        end = line.end + offset_ms
+        line.start = start if start > 0 else 0
+        line.end = end if end > 0 else 0
 
 
 class SyncMethod(Enum):
@@ -33,7 +93,7 @@ class SyncMethod(Enum):
     NONE = "none"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SyncResult:
     """Result of a synchronization operation"""
     success: bool
@@ -43,6 +103,9 @@ class SyncResult:
     confidence: Optional[float] = None
     error: Optional[str] = None
     details: Optional[Dict] = None
+    # Synchronized subtitles, set instead of writing output_path when the
+    # plugin supports in-memory results and in_memory=True was requested
+    subtitles: Optional[pysubs2.SSAFile] = None
 
 
 class SyncPlugin(ABC):
@@ -67,7 +130,9 @@ class SyncPlugin(ABC):
             reference_path: Path to reference subtitle (or video for some methods)
             target_path: Path to subtitle to be synchronized
             output_path: Path where synchronized subtitle should be saved
-            **kwargs: Additional method-specific parameters
+            **kwargs: Additional method-specific parameters. Plugins that work on
+                pysubs2 objects honour in_memory=True by returning the result in
+                SyncResult.subtitles instead of saving to output_path.
             
         Returns:
             SyncResult with details of the synchronization
@@ -202,19 +267,13 @@ class ManualOffsetPlugin(SyncPlugin):
             # Load subtitle file
             subs = pysubs2.load(target_path)
             
-            # Apply offset to all subtitle entries
-            for line in subs:
-                line.start += offset_ms
-                line.end += offset_ms
-                
-                # Ensure no negative timestamps
-                if line.start < 0:
-                    line.start = 0
-                if line.end < 0:
-                    line.end = 0
+            # Apply offset to all subtitle entries (no negative timestamps)
+            _shift_subtitles(subs, offset_ms)
             
             # Save adjusted subtitle
-            subs.save(output_path)
+            in_memory = kwargs.get('in_memory', False)
+            if not in_memory:
+                subs.save(output_path)
             
             return SyncResult(
                 success=True,
@@ -222,7 +281,8 @@ class ManualOffsetPlugin(SyncPlugin):
                 output_path=output_path,
                 offset_ms=offset_ms,
                 confidence=1.0,  # Manual offset is exact
-                details={'lines_adjusted': len(subs)}
+                details={'lines_adjusted': len(subs)},
+                subtitles=subs if in_memory else None
             )
             
         except Exception as e:
@@ -254,20 +314,20 @@ class AutoAlignPlugin(SyncPlugin):
         """
         
         try:
-            ref_subs = pysubs2.load(reference_path)
+            # The reference is only read, so bulk jobs against one reference
+            # share its parse; the target is shifted in place and loaded fresh
+            ref_subs = _load_reference(reference_path)
             target_subs = pysubs2.load(target_path)
             
             if not ref_subs or not target_subs:
                 raise SubtitleFormatError(target_path, "Empty subtitle file")
             
-            # Calculate average offset based on first few subtitles
-            offset_samples = []
+            # Offsets between the first few paired subtitles, in sorted order
             sample_size = min(10, len(ref_subs), len(target_subs))
-            
-            for i in range(sample_size):
-                if i < len(ref_subs) and i < len(target_subs):
-                    offset = ref_subs[i].start - target_subs[i].start
-                    offset_samples.append(offset)
+            offset_samples = sorted(
+                ref.start - target.start
+                for ref, target in zip(ref_subs.events[:sample_size], target_subs.events[:sample_size])
+            )
             
             if not offset_samples:
                 # No samples available, can't align
@@ -282,22 +342,15 @@ class AutoAlignPlugin(SyncPlugin):
                 )
             
             # Use median offset to reduce impact of outliers
-            offset_samples.sort()
             median_offset = offset_samples[len(offset_samples) // 2]
             
-            # Apply the calculated offset
-            for line in target_subs:
-                line.start += median_offset
-                line.end += median_offset
-                
-                # Ensure no negative timestamps
-                if line.start < 0:
-                    line.start = 0
-                if line.end < 0:
-                    line.end = 0
+            # Apply the calculated offset (no negative timestamps)
+            _shift_subtitles(target_subs, median_offset)
             
             # Save aligned subtitle
-            target_subs.save(output_path)
+            in_memory = kwargs.get('in_memory', False)
+            if not in_memory:
+                target_subs.save(output_path)
             
             # Calculate confidence based on offset consistency
             offset_variance = sum((o - median_offset) ** 2 for o in offset_samples) / len(offset_samples)
@@ -312,7 +365,8 @@ class AutoAlignPlugin(SyncPlugin):
                 details={
                     'samples_used': len(offset_samples),
                     'offset_variance': offset_variance
-                }
+                },
+                subtitles=target_subs if in_memory else None
             )
             
         except Exception as e:
@@ -324,6 +378,19 @@ class AutoAlignPlugin(SyncPlugin):
             )
 
 
+# Per-process synchronizer for batch workers, built on first use so plugin
+# availability checks run once per worker rather than once per job
+_worker_synchronizer = None
+
+
+def _run_one(job: Tuple[str, str, str], method: Optional['SyncMethod'], fallback: bool, kwargs: Dict) -> 'SyncResult':
+    """Batch worker: synchronize one (reference, target, output) job"""
+    global _worker_synchronizer
+    if _worker_synchronizer is None:
+        _worker_synchronizer = SubtitleSynchronizer()
+    return _worker_synchronizer.sync_subtitles(*job, method=method, fallback=fallback, **kwargs)
+
+
 class SubtitleSynchronizer:
     """Main synchronizer that manages all sync plugins"""
     
@@ -334,6 +401,9 @@ class SubtitleSynchronizer:
             ManualOffsetPlugin()
         ]
         self._available_methods = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
+        self._shutdown_registered = False
     
     @property
     def available_methods(self) -> List[SyncMethod]:
@@ -432,6 +502,58 @@ class SubtitleSynchronizer:
             error=f"All sync methods failed. Last error: {last_error}"
         )
     
+    def sync_subtitles_batch(
+        self,
+        jobs: List[Tuple[str, str, str]],
+        method: Optional[SyncMethod] = None,
+        fallback: bool = True,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[SyncResult]:
+        """
+        Synchronize several (reference, target, output) jobs in worker processes
+        
+        ffsubsync is CPU-bound and threads internally, so the default uses half
+        the cores. The pool is kept between calls to avoid paying process
+        startup per batch; it is shut down at interpreter exit, or earlier via
+        shutdown(). Workers are spawned, so callers running this from a script
+        need an ``if __name__ == "__main__"`` guard. Results come back in job
+        order, with failed jobs as unsuccessful results.
+        """
+        if not jobs:
+            return []
+        
+        workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        if self._executor is None or self._executor_workers != workers:
+            self.shutdown()
+            self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=_batch_mp_context)
+            self._executor_workers = workers
+            if not self._shutdown_registered:
+                atexit.register(self.shutdown)
+                self._shutdown_registered = True
+        
+        futures = [self._executor.submit(_run_one, job, method, fallback, kwargs) for job in jobs]
+        
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(SyncResult(
+                    success=False,
+                    method=method or SyncMethod.NONE,
+                    output_path=job[2],
+                    error=str(e)
+                ))
+        return results
+    
+    def shutdown(self):
+        """Stop the batch worker pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
+    
     def get_method_descriptions(self) -> Dict[SyncMethod, str]:
         """Get descriptions of all available methods"""
         descriptions = {}
@@ -0,0 +1,80 @@
+"""
+Subtitle event helpers shared by the subtitle services
+"""
+
+import heapq
+import operator
+import os
+import re
+from typing import List
+
+import pysubs2
+from pysubs2.subrip import SubripFormat
+
+_get_start_end = operator.attrgetter('start', 'end')
+_NEWLINE_RUN_RE = re.compile("\n+")
+
+
+def merge_sorted_events(
+    first: List[pysubs2.SSAEvent], second: List[pysubs2.SSAEvent]
+) -> List[pysubs2.SSAEvent]:
+    """
+    Merge two event lists into one ordered by (start, end)
+    
+    Same order as SSAFile.sort() on the concatenation, ties going to `first`.
+    Subtitle files are nearly always in time order already, so sorting each
+    list is a linear pass and the merge skips the full O(n log n) sort.
+    """
+    first.sort()
+    second.sort()
+    return list(heapq.merge(first, second, key=_get_start_end))
+
+
+def is_plain_text(subs: pysubs2.SSAFile) -> bool:
+    """True if no event carries override tags or an italic/underline/strikeout style"""
+    default_style = pysubs2.SSAStyle.DEFAULT_STYLE
+    for line in subs.events:
+        style = subs.styles.get(line.style, default_style)
+        if '{' in line.text or style.italic or style.underline or style.strikeout:
+            return False
+    return True
+
+
+def write_plain_srt(subs: pysubs2.SSAFile, output_path: str):
+    """
+    Stream events straight to an SRT file
+    
+    Matches pysubs2's SRT output for subtitles accepted by is_plain_text,
+    without its per-line tag parsing.
+    """
+    to_timestamp = SubripFormat.ms_to_timestamp
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 16) as fp:
+        lineno = 1
+        for line in subs.events:
+            if line.is_comment:
+                continue
+            text = line.text.replace(r"\h", " ").replace(r"\n", "\n").replace(r"\N", "\n")
+            text = _NEWLINE_RUN_RE.sub("\n", text.strip())
+            fp.write(f"{lineno}\n{to_timestamp(line.start)} --> {to_timestamp(line.end)}\n{text}\n\n")
+            lineno += 1
+
+
+def save_srt(subs: pysubs2.SSAFile, output_path: str):
+    """
+    Save subtitles as SRT, streaming plain text and leaving markup to pysubs2
+    
+    Written next to the target and renamed, so readers never see a partial file.
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        if is_plain_text(subs):
+            write_plain_srt(subs, tmp_path)
+        else:
+            subs.save(tmp_path, format_='srt')
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,79 @@
+"""
+Tests for SubtitleService
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from services.subtitle_service import SubtitleService
+
+
+PRIMARY_SRT = """1
+00:00:01,000 --> 00:00:02,500
+Hello there
+
+2
+00:00:03,000 --> 00:00:04,000
+How are you?
+"""
+
+SECONDARY_SRT = """1
+00:00:01,100 --> 00:00:02,400
+Bonjour
+
+2
+00:00:03,100 --> 00:00:04,100
+Comment ça va ?
+"""
+
+
+class CreateDualSubtitlesBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.primary = self.tmp / "primary.en.srt"
+        self.secondary = self.tmp / "secondary.fr.srt"
+        self.primary.write_text(PRIMARY_SRT, encoding="utf-8")
+        self.secondary.write_text(SECONDARY_SRT, encoding="utf-8")
+    
+    def _job(self, name: str) -> dict:
+        return {
+            "primary_path": str(self.primary),
+            "secondary_path": str(self.secondary),
+            "output_path": str(self.tmp / name),
+            "enable_sync": False,
+        }
+    
+    def test_batch_after_in_process_call(self):
+        # The in-process call starts the shared I/O thread pool; batch
+        # workers must not inherit it in a broken state and hang
+        single = SubtitleService.create_dual_subtitle(**self._job("single.ass"))
+        self.assertTrue(single["success"], single)
+        
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(
+                SubtitleService.create_dual_subtitles_batch([self._job("a.ass"), self._job("b.ass")])
+            ),
+            daemon=True
+        )
+        worker.start()
+        worker.join(timeout=120)
+        self.assertFalse(worker.is_alive(), "create_dual_subtitles_batch hung")
+        
+        self.assertEqual([r["success"] for r in results], [True, True], results)
+        expected = (self.tmp / "single.ass").read_bytes()
+        self.assertEqual((self.tmp / "a.ass").read_bytes(), expected)
+        self.assertEqual((self.tmp / "b.ass").read_bytes(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for SubtitleSynchronizer
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pysubs2
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from services.sync_plugins import SubtitleSynchronizer, SyncMethod
+
+
+TARGET_SRT = """1
+00:00:01,000 --> 00:00:02,500
+Hello there
+
+2
+00:00:03,000 --> 00:00:04,000
+How are you?
+"""
+
+
+class SyncSubtitlesBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.target = self.tmp / "target.srt"
+        self.target.write_text(TARGET_SRT, encoding="utf-8")
+        self.synchronizer = SubtitleSynchronizer()
+        self.addCleanup(self.synchronizer.shutdown)
+
+    def test_results_in_job_order_with_failures(self):
+        good_out = self.tmp / "good.srt"
+        bad_out = self.tmp / "bad.srt"
+        jobs = [
+            (str(self.target), str(self.tmp / "missing.srt"), str(bad_out)),
+            (str(self.target), str(self.target), str(good_out)),
+        ]
+
+        results = self.synchronizer.sync_subtitles_batch(
+            jobs, method=SyncMethod.MANUAL_OFFSET, fallback=False, max_workers=2, offset_ms=500
+        )
+
+        self.assertEqual([r.output_path for r in results], [str(bad_out), str(good_out)])
+        self.assertFalse(results[0].success, results[0])
+        self.assertTrue(results[1].success, results[1])
+        self.assertEqual(results[1].offset_ms, 500)
+        self.assertEqual(pysubs2.load(str(good_out))[0].start, 1500)
+
+    def test_shutdown_is_idempotent(self):
+        self.synchronizer.sync_subtitles_batch(
+            [(str(self.target), str(self.target), str(self.tmp / "out.srt"))],
+            method=SyncMethod.MANUAL_OFFSET, max_workers=1, offset_ms=100
+        )
+        self.synchronizer.shutdown()
+        self.synchronizer.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()